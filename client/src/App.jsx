@@ -9,14 +9,19 @@ function App() {
   const [location, setLocation] = useState('');
   const [jobs, setJobs] = useState([]);
   const [selectedJob, setSelectedJob] = useState(null);
+  const [jobScores, setJobScores] = useState({});
   const [loading, setLoading] = useState(false);
   
   // AI Analysis State
   const [analysisResult, setAnalysisResult] = useState(null);
   const [analyzing, setAnalyzing] = useState(false);
+  const [aiPending, setAiPending] = useState(false);
+  const [resultSource, setResultSource] = useState("");
   
   // Ref for auto-scrolling to results
   const resultsRef = useRef(null);
+  // Open Server-Sent Events stream for the running analysis
+  const eventsRef = useRef(null);
 
   // 1. Upload Resume
   const handleFileChange = async (e) => {
@@ -38,6 +43,7 @@ function App() {
     if (!jobRole) return alert("Enter a job role");
     setLoading(true);
     setJobs([]);
+    setJobScores({});
     setSelectedJob(null);
     setAnalysisResult(null);
     
@@ -49,6 +55,17 @@ function App() {
     try {
       const res = await axios.post('http://localhost:8000/search-jobs', formData);
       setJobs(res.data.jobs);
+
+      // Score every result against the resume in one request
+      if (filename) {
+        const rankData = new FormData();
+        rankData.append('filename', filename);
+        rankData.append('jobs', JSON.stringify(res.data.jobs));
+        const ranked = await axios.post('http://localhost:8000/rank-jobs', rankData);
+        const scores = {};
+        ranked.data.jobs.forEach(j => { scores[j.id] = j.match_score; });
+        setJobScores(scores);
+      }
     } catch (err) {
       console.error(err);
     }
@@ -56,11 +73,15 @@ function App() {
   };
 
   // 3. Run AI Analysis (Connected to all 4 Buttons)
+  // The server answers with a job id at once, then streams: the local score
+  // first, AI tokens while the model writes, and the AI result at the end.
   const runAnalysis = async () => {
     if (!filename) return alert("Please upload a resume first!");
     if (!selectedJob) return alert("Please select a job first!");
     
+    eventsRef.current?.close();
     setAnalyzing(true);
+    setAiPending(false);
     setAnalysisResult(null); // Clear old results
 
     const formData = new FormData();
@@ -69,19 +90,43 @@ function App() {
     formData.append('job_desc', selectedJob.snippet);
 
     try {
-      const res = await axios.post('http://localhost:8000/analyze-match', formData);
-      setAnalysisResult(res.data);
-      
-      // Auto-scroll to results after short delay
-      setTimeout(() => {
-        resultsRef.current?.scrollIntoView({ behavior: 'smooth' });
-      }, 100);
-      
+      const res = await axios.post('http://localhost:8000/analysis-jobs', formData);
+      const events = new EventSource(`http://localhost:8000${res.data.events_url}`);
+      eventsRef.current = events;
+
+      events.addEventListener('local_result', (e) => {
+        setAnalysisResult(JSON.parse(e.data));
+        setResultSource("local");
+        setAnalyzing(false);
+        setAiPending(true);
+        
+        // Auto-scroll to results after short delay
+        setTimeout(() => {
+          resultsRef.current?.scrollIntoView({ behavior: 'smooth' });
+        }, 100);
+      });
+      events.addEventListener('ai_result', (e) => {
+        setAnalysisResult(JSON.parse(e.data));
+        setResultSource("ai");
+      });
+      events.addEventListener('done', () => {
+        setAiPending(false);
+        events.close();
+      });
+      events.addEventListener('error', (e) => {
+        // Named "error" events come from the server; bare ones are connection drops
+        if (e.data) console.error(JSON.parse(e.data));
+        if (e.data || events.readyState === EventSource.CLOSED) {
+          setAnalyzing(false);
+          setAiPending(false);
+          events.close();
+        }
+      });
     } catch (err) {
       alert("Analysis failed. Check console.");
       console.error(err);
+      setAnalyzing(false);
     }
-    setAnalyzing(false);
   };
 
   return (
@@ -124,6 +169,7 @@ function App() {
                   <div className="job-info">
                     <h3>{job.title}</h3>
                     <p style={{fontSize:'0.8rem', color:'#666'}}>{job.snippet.substring(0,60)}...</p>
+                    {jobScores[job.id] !== undefined && <p style={{fontSize:'0.8rem', color:'#ff4500', fontWeight:'bold'}}>{jobScores[job.id]}% match</p>}
                   </div>
                   <span className={`badge ${job.source}`}>{job.source}</span>
                </div>
@@ -173,6 +219,12 @@ function App() {
              </div>
           )}
 
+          {aiPending && (
+             <div style={{textAlign:'center', marginTop:'15px', color:'#666'}}>
+               🤖 Quick score ready, AI is refining the analysis...
+             </div>
+          )}
+
           {/* RESULTS DASHBOARD */}
           {analysisResult && (
             <div className="results-container" ref={resultsRef}>
@@ -183,7 +235,7 @@ function App() {
                   <span>{analysisResult.match_score}%</span>
                 </div>
                 <h3>Match Probability</h3>
-                <p>Based on keyword overlap (TF-IDF)</p>
+                <p>{resultSource === "ai" ? "AI analysis" : "Based on keyword overlap (TF-IDF)"}</p>
               </div>
 
               {/* 2. Missing Skills */}
@@ -0,0 +1,185 @@
+import asyncio
+import itertools
+import time
+import uuid
+from collections import defaultdict, deque
+
+# ==========================================================
+# 🧵 ANALYSIS JOB SCHEDULER
+# ==========================================================
+# POST returns a job id straight away; a fixed pool of async workers runs the
+# jobs. Interactive jobs jump ahead of batch ones, each user has a cap on
+# running jobs, and submitting a job identical to one still pending/running
+# returns the existing id. Every job keeps its event history, so subscribers
+# (SSE streams) can attach late or reconnect and still see everything.
+
+PRIORITIES = {"interactive": 0, "batch": 1}
+
+
+class SchedulerFull(Exception):
+    pass
+
+
+class AnalysisJob:
+    def __init__(self, key, user, priority, runner):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.user = user
+        self.priority = priority
+        self.runner = runner
+        self.status = "queued"
+        self.result = None
+        self.events = []  # [(event_id, name, data)]
+        self.finished_at = None
+        self._subscribers = set()
+
+    @property
+    def done(self):
+        return self.status in ("done", "failed")
+
+    def emit(self, name, data):
+        event = (len(self.events), name, data)
+        self.events.append(event)
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    def finish(self, status):
+        self.status = status
+        self.finished_at = time.monotonic()
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+    async def subscribe(self, after=-1, heartbeat=15.0):
+        """Yields (event_id, name, data) from after+1 on, then live ones until the job ends.
+        Yields None every `heartbeat` seconds of silence so the caller can keep the stream alive."""
+        queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        # Everything emitted from here on goes to the queue, the rest is history
+        history = self.events[after + 1:]
+        finished = self.done
+        try:
+            for event in history:
+                yield event
+            if finished:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is None:
+                    return
+                if event[0] > after:
+                    yield event
+        finally:
+            self._subscribers.discard(queue)
+
+    def snapshot(self):
+        return {"job_id": self.id, "status": self.status, "result": self.result, "events": len(self.events)}
+
+
+class JobScheduler:
+    def __init__(self, workers=4, per_user_limit=2, max_pending=200, keep_finished=600.0):
+        self.workers = workers
+        self.per_user_limit = per_user_limit
+        self.max_pending = max_pending
+        self.keep_finished = keep_finished
+
+        self.jobs = {}  # job_id -> AnalysisJob
+        self._active = {}  # dedup key -> job still queued or running
+        self._queue = None
+        self._order = itertools.count()  # FIFO among equal priorities
+        self._running_by_user = defaultdict(int)
+        self._deferred = defaultdict(deque)  # user -> queue entries waiting for a free slot
+        self._tasks = []
+        self._stats = {"submitted": 0, "deduplicated": 0, "rejected": 0, "completed": 0, "failed": 0}
+
+    def _start(self):
+        # Workers need a running loop, so they start with the first job
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+            self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        # Cancelled workers skip their except branch, so end every queued / running job
+        # here first; otherwise its subscribers would get keep-alives forever
+        for job in list(self._active.values()):
+            self._stats["failed"] += 1
+            job.emit("error", {"detail": "Server is shutting down"})
+            job.finish("failed")
+        self._active.clear()
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._deferred.clear()
+
+    def stats(self):
+        pending = self._queue.qsize() if self._queue else 0
+        pending += sum(len(d) for d in self._deferred.values())
+        return {**self._stats, "pending": pending, "running": sum(self._running_by_user.values()), "tracked": len(self.jobs)}
+
+    def submit(self, key, user, runner, priority="interactive"):
+        """Queues runner(job) unless an identical job is already active. Returns (job, deduplicated)."""
+        self._start()
+        self._forget_old_jobs()
+
+        existing = self._active.get(key)
+        if existing is not None:
+            self._stats["deduplicated"] += 1
+            return existing, True
+
+        if len(self._active) >= self.max_pending:
+            self._stats["rejected"] += 1
+            raise SchedulerFull("Too many analyses in progress, try again shortly")
+
+        job = AnalysisJob(key, user, PRIORITIES.get(priority, PRIORITIES["interactive"]), runner)
+        self.jobs[job.id] = job
+        self._active[key] = job
+        self._stats["submitted"] += 1
+        self._queue.put_nowait((job.priority, next(self._order), job))
+        job.emit("queued", {"job_id": job.id})
+        return job, False
+
+    def _forget_old_jobs(self):
+        cutoff = time.monotonic() - self.keep_finished
+        for job_id in [j.id for j in self.jobs.values() if j.done and j.finished_at < cutoff]:
+            del self.jobs[job_id]
+
+    async def _worker(self):
+        while True:
+            entry = await self._queue.get()
+            job = entry[2]
+            if self._running_by_user[job.user] >= self.per_user_limit:
+                # Park it; it goes back in the queue when one of the user's jobs ends
+                self._deferred[job.user].append(entry)
+                continue
+
+            self._running_by_user[job.user] += 1
+            job.status = "running"
+            job.emit("started", {})
+            try:
+                job.result = await job.runner(job)
+                self._stats["completed"] += 1
+                job.emit("done", job.result)
+                job.finish("done")
+            except Exception as e:
+                print(f"❌ Analysis job {job.id} failed: {e}")
+                self._stats["failed"] += 1
+                job.emit("error", {"detail": str(e)})
+                job.finish("failed")
+            finally:
+                self._active.pop(job.key, None)
+                self._running_by_user[job.user] -= 1
+                if self._deferred[job.user]:
+                    self._queue.put_nowait(self._deferred[job.user].popleft())
+                # Don't keep a counter / empty deque around for every user ever seen
+                if not self._running_by_user[job.user]:
+                    del self._running_by_user[job.user]
+                if not self._deferred[job.user]:
+                    del self._deferred[job.user]
+                # Not only on submit: with no new jobs coming in, old ones would never go
+                self._forget_old_jobs()
@@ -0,0 +1,210 @@
+"""Offline end-to-end benchmark for the FastAPI app.
+
+Drives main.app in-process (httpx ASGI transport) with synthetic PDFs of
+different sizes, stub_adzuna.py in place of Adzuna and fake_llm.py in place
+of Gemini, then reports p50/p95/p99 latency and throughput per scenario.
+
+Run with:
+    python bench_api.py                              # print the table
+    python bench_api.py --save baseline.json         # keep the numbers
+    python bench_api.py --baseline baseline.json     # exit 1 if any p95 regressed
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+from fake_llm import FakeModelBackend
+from stub_adzuna import start_stub
+
+SEED = 1234
+FILLER = ("team project delivered built designed improved managed led developed tested deployed "
+          "customers product platform service data reports pipeline features release quality").split()
+SKILLS = ["python", "java", "react", "node.js", "sql", "docker", "kubernetes", "aws", "git", "c++",
+          "machine learning", "pandas", "tableau", "jira", "linux", "ci/cd", "html", "css"]
+
+
+def make_pdf(pages, seed, words_per_page=350):
+    """A valid, uncompressed text PDF built by hand (no PDF library needed)"""
+    rng = random.Random(seed)
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for _ in range(pages):
+        words = [rng.choice(SKILLS) if rng.random() < 0.08 else rng.choice(FILLER) for _ in range(words_per_page)]
+        lines = [" ".join(words[i:i + 12]) for i in range(0, len(words), 12)]
+        stream = "BT /F1 10 Tf 12 TL 40 800 Td " + " ".join(f"({line}) '" for line in lines) + " ET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects) + 2} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def percentiles(latencies):
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return cuts[49], cuts[94], cuts[98]
+
+
+async def run_scenario(name, requests, send, concurrency):
+    """Sends every request with at most `concurrency` in flight; returns a result row"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def one(request):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await send(request)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(r) for r in requests))
+    wall = time.perf_counter() - start
+
+    p50, p95, p99 = percentiles(latencies)
+    return {"scenario": name, "requests": len(requests), "concurrency": concurrency, "errors": errors,
+            "p50_ms": p50 * 1000, "p95_ms": p95 * 1000, "p99_ms": p99 * 1000, "rps": len(requests) / wall}
+
+
+async def main(args):
+    import httpx
+
+    random.seed(SEED)
+    workdir = tempfile.mkdtemp(prefix="resumematch_bench_")
+    os.chdir(workdir)  # uploads/, resume_cache/ and resume_index.jsonl land here
+
+    stub, stub_url = start_stub(latency=args.adzuna_latency, error_rate=args.adzuna_errors)
+    os.environ["ADZUNA_BASE_URL"] = stub_url
+    # The stub ignores credentials, but /search-jobs only calls Adzuna when they are set
+    os.environ.setdefault("ADZUNA_APP_ID", "bench")
+    os.environ.setdefault("ADZUNA_APP_KEY", "bench")
+
+    import main as app_module
+    from llm_client import LLMClient
+
+    healthy_llm = LLMClient(app_module.MODEL_OPTIONS, FakeModelBackend(default={"latency": args.llm_latency}))
+    broken_llm = LLMClient(app_module.MODEL_OPTIONS, FakeModelBackend(default={"mode": "error"}))
+    app_module.LLM = healthy_llm
+
+    n = args.requests
+    transport = httpx.ASGITransport(app=app_module.app)
+    rows = []
+    # The ASGI transport doesn't send lifespan events, so run startup / shutdown here
+    async with app_module.app.router.lifespan_context(app_module.app), \
+            httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+
+        # 1. Uploads: unique PDFs so every request really parses
+        uploaded = {}
+        for label, pages in (("small", 1), ("medium", 10), ("large", 50)):
+            pdfs = [make_pdf(pages, seed=SEED + pages * 1000 + i) for i in range(n)]
+
+            async def upload(pdf):
+                return await client.post("/upload-resume", files={"file": ("resume.pdf", pdf, "application/pdf")})
+
+            rows.append(await run_scenario(f"upload_{label}_{pages}p", pdfs, upload, args.concurrency))
+            response = await upload(pdfs[0])
+            uploaded[label] = response.json()["filename"]
+
+        resume = uploaded["medium"]
+
+        async def analyze(job_desc):
+            return await client.post("/analyze-match", data={
+                "filename": resume, "job_title": "Senior Full Stack Developer", "job_desc": job_desc})
+
+        # 2. Analysis: fresh AI calls, cached AI answers, and local fallback with every model down
+        fresh = [f"Build React and Node.js services #{i}" for i in range(n)]
+        rows.append(await run_scenario("analyze_ai_fresh", fresh, analyze, args.concurrency))
+        rows.append(await run_scenario("analyze_ai_cached", fresh, analyze, args.concurrency))
+        app_module.LLM = broken_llm
+        rows.append(await run_scenario("analyze_local_fallback",
+                                       [f"fallback #{i}" for i in range(n)], analyze, args.concurrency))
+        app_module.LLM = healthy_llm
+
+        # 3. Job search against the stub (unique roles, so nothing is served from the TTL cache)
+        async def search(role):
+            return await client.post("/search-jobs", data={"role": role, "location": "pune", "count": 100})
+
+        roles = [f"data engineer {i}" for i in range(n)]
+        rows.append(await run_scenario("search_jobs_100", roles, search, args.concurrency))
+
+        # 4. Ranking 500 pasted job descriptions in one call
+        jobs = json.dumps([f"Engineer {i}\nNeeds {' '.join(random.sample(SKILLS, 5))} and teamwork."
+                           for i in range(500)])
+
+        async def rank(_):
+            return await client.post("/rank-jobs", data={"filename": resume, "jobs": jobs})
+
+        rows.append(await run_scenario("rank_jobs_500", list(range(n)), rank, args.concurrency))
+
+    stub.shutdown()
+    return rows
+
+
+def print_table(rows):
+    print(f"{'scenario':<26} {'reqs':>5} {'conc':>5} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}")
+    for r in rows:
+        print(f"{r['scenario']:<26} {r['requests']:>5} {r['concurrency']:>5} {r['errors']:>4} "
+              f"{r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['rps']:>8.1f}")
+
+
+def check_baseline(rows, path, tolerance):
+    """Returns the scenarios whose p95 got worse than baseline * (1 + tolerance)"""
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = {r["scenario"]: r for r in json.load(f)}
+    regressions = []
+    for row in rows:
+        old = baseline.get(row["scenario"])
+        if old and row["p95_ms"] > old["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{row['scenario']}: p95 {old['p95_ms']:.1f} ms -> {row['p95_ms']:.1f} ms")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=40, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="fake Gemini latency (s)")
+    parser.add_argument("--adzuna-latency", type=float, default=0.05, help="stub Adzuna latency (s)")
+    parser.add_argument("--adzuna-errors", type=float, default=0.0, help="stub Adzuna error rate")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare p95 against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 slowdown vs baseline")
+    args = parser.parse_args()
+
+    save_path = os.path.abspath(args.save) if args.save else None
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+
+    results = asyncio.run(main(args))
+    print_table(results)
+
+    if save_path:
+        with open(save_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if baseline_path:
+        regressions = check_baseline(results, baseline_path, args.tolerance)
+        for line in regressions:
+            print(f"❌ REGRESSION {line}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,86 @@
+"""Benchmark: role resolution and skill scoring with 10k roles.
+
+Compares the old linear substring scan + set arithmetic with RoleIndex
+(inverted title index + bitmask scoring).
+
+Run with:  python bench_role_index.py
+"""
+import random
+import string
+import time
+
+from role_index import RoleIndex
+
+random.seed(7)
+
+ROLE_COUNT = 10_000
+SKILL_COUNT = 2_000
+QUERIES = 5_000
+
+SENIORITY = ["", "senior ", "junior ", "lead ", "principal ", "staff "]
+SUFFIXES = ["engineer", "developer", "analyst", "manager", "designer", "specialist"]
+
+
+def random_word():
+    return "".join(random.choices(string.ascii_lowercase, k=random.randint(4, 9)))
+
+
+def make_roles():
+    skills = [random_word() for _ in range(SKILL_COUNT)]
+    roles = {}
+    while len(roles) < ROLE_COUNT:
+        domain = f"{random_word()} {random_word()}"
+        key = f"{domain} {random.choice(SUFFIXES)}"
+        roles[key] = {
+            "synonyms": [f"{domain} {suffix}" for suffix in random.sample(SUFFIXES, 2)],
+            "required": set(random.sample(skills, random.randint(5, 15))),
+        }
+    return roles, skills
+
+
+def legacy_resolve(title, roles):
+    job_title_lower = title.lower()
+    for key in roles:
+        if key in job_title_lower or job_title_lower in key:
+            return key
+    return None
+
+
+def legacy_score(required, have):
+    matched = required.intersection(have)
+    return len(matched), len(required), required - have
+
+
+def timed(fn, items):
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    elapsed = time.perf_counter() - start
+    return elapsed, len(items) / elapsed
+
+
+if __name__ == "__main__":
+    roles, skills = make_roles()
+    keys = list(roles)
+
+    start = time.perf_counter()
+    index = RoleIndex(roles, skills)
+    print(f"Index build: {(time.perf_counter() - start) * 1000:.0f} ms for {ROLE_COUNT} roles")
+
+    titles = [f"{random.choice(SENIORITY)}{random.choice(keys)}".title() for _ in range(QUERIES)]
+    legacy_time, legacy_rate = timed(lambda t: legacy_resolve(t, roles), titles)
+    index_time, index_rate = timed(index.resolve, titles)
+    print(f"Resolution  legacy: {legacy_rate:>10,.0f} titles/s   index: {index_rate:>10,.0f} titles/s   "
+          f"({legacy_time / index_time:.0f}x)")
+
+    resumes = [set(random.sample(skills, 40)) for _ in range(200)]
+    pairs = [(random.choice(keys), random.choice(resumes)) for _ in range(QUERIES * 10)]
+    masks = {id(r): index.vocabulary.mask(r) for r in resumes}
+    legacy_time, legacy_rate = timed(lambda p: legacy_score(roles[p[0]]["required"], p[1]), pairs)
+    index_time, index_rate = timed(lambda p: index.score(p[0], masks[id(p[1])]), pairs)
+    print(f"Scoring     legacy: {legacy_rate:>10,.0f} pairs/s    index: {index_rate:>10,.0f} pairs/s    "
+          f"({legacy_time / index_time:.1f}x)")
+
+    # Sanity check: resolution lands on a role that shares the title's domain
+    hits = sum(index.resolve(t).split()[:2] == t.lower().split()[-3:-1] for t in titles)
+    print(f"Resolved to the right domain: {hits / len(titles):.1%}")
@@ -0,0 +1,72 @@
+"""Benchmark: per-skill regex loop vs the compiled SkillMatcher.
+
+Run with:  python bench_skill_matcher.py
+"""
+import random
+import re
+import string
+import time
+
+from skill_matcher import SkillMatcher
+
+random.seed(42)
+
+TAXONOMY_SIZES = [70, 1_000, 10_000]
+RESUME_LENGTHS = [2_000, 10_000, 50_000]  # characters
+REPEATS = 5
+
+
+def legacy_extract(text, skills):
+    """The old extract_skills_from_text: one re.search per skill"""
+    found = set()
+    text = text.lower()
+    for skill in skills:
+        if re.search(r'\b' + re.escape(skill) + r'\b', text):
+            found.add(skill)
+    return found
+
+
+def random_word():
+    return "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 10)))
+
+
+def make_taxonomy(size):
+    skills = set()
+    while len(skills) < size:
+        # Mix of single words and two-word phrases, like the real DB
+        skill = random_word() if random.random() < 0.7 else f"{random_word()} {random_word()}"
+        skills.add(skill)
+    return sorted(skills)
+
+
+def make_resume(length, skills):
+    words = []
+    while sum(len(w) + 1 for w in words) < length:
+        words.append(random.choice(skills) if random.random() < 0.05 else random_word())
+    return " ".join(words)
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    print(f"{'skills':>8} {'chars':>8} {'legacy ms':>11} {'matcher ms':>11} {'speedup':>8} {'build ms':>9}")
+    for size in TAXONOMY_SIZES:
+        skills = make_taxonomy(size)
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build = time.perf_counter() - start
+
+        for length in RESUME_LENGTHS:
+            resume = make_resume(length, skills)
+            legacy_time, legacy_found = best_of(lambda: legacy_extract(resume, skills))
+            matcher_time, matcher_found = best_of(lambda: matcher.skills(resume))
+            assert legacy_found == matcher_found, "matcher disagrees with the legacy loop"
+            print(f"{size:>8} {length:>8} {legacy_time * 1000:>11.2f} {matcher_time * 1000:>11.2f} "
+                  f"{legacy_time / matcher_time:>7.1f}x {build * 1000:>9.1f}")
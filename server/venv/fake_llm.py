@@ -0,0 +1,62 @@
+"""Offline stand-in for GeminiBackend, for exercising LLMClient without an API key.
+
+    backend = FakeModelBackend({"model-a": {"mode": "rate_limit"}, "model-b": {"latency": 0.2}})
+    LLMClient(["model-a", "model-b"], backend)
+"""
+import json
+import threading
+import time
+
+
+class ResourceExhausted(Exception):
+    """Same name as google.api_core's 429 error, so is_rate_limit() treats it alike"""
+
+
+class FakeModelBackend:
+    """Per-model behaviour: {"latency": seconds, "mode": "ok" | "error" | "rate_limit" | "garbage" | "drop"}
+
+    "drop" streams the first couple of chunks of a normal answer, then fails.
+    """
+
+    def __init__(self, behaviours=None, default=None):
+        self.behaviours = behaviours or {}
+        self.default = default or {"latency": 0.0, "mode": "ok"}
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, model_name, prompt, timeout):
+        return "".join(self.stream(model_name, prompt, timeout))
+
+    def stream(self, model_name, prompt, timeout):
+        """Yields the answer in small chunks, spreading `latency` across them"""
+        behaviour = {**self.default, **self.behaviours.get(model_name, {})}
+        with self._lock:
+            self.calls.append(model_name)
+
+        mode = behaviour.get("mode", "ok")
+        if mode == "error":
+            time.sleep(behaviour.get("latency", 0.0))
+            raise RuntimeError(f"{model_name} is unavailable")
+        if mode == "rate_limit":
+            time.sleep(behaviour.get("latency", 0.0))
+            raise ResourceExhausted("429 Quota exceeded")
+        if mode == "garbage":
+            text = "Sorry, I can't help with that."
+        else:
+            text = self._answer(model_name)
+
+        chunks = [text[i:i + 16] for i in range(0, len(text), 16)]
+        for number, chunk in enumerate(chunks):
+            if mode == "drop" and number == 2:
+                raise RuntimeError(f"{model_name} dropped the connection")
+            time.sleep(behaviour.get("latency", 0.0) / len(chunks))
+            yield chunk
+
+    @staticmethod
+    def _answer(model_name):
+        return "```json\n" + json.dumps({
+            "match_score": 72,
+            "missing_skills": ["docker", "kubernetes"],
+            "improvements": [f"Answered by {model_name}"],
+            "roadmap": ["Week 1: Fake it.", "Week 2: Make it."]
+        }) + "\n```"
@@ -0,0 +1,128 @@
+import re
+
+import numpy as np
+from scipy import sparse
+
+# ==========================================================
+# 📈 BATCH JOB RANKER (TF-IDF + SKILL COVERAGE)
+# ==========================================================
+# Scores one resume against many jobs at once. All jobs go into two sparse
+# matrices (TF-IDF terms and skills), so every score comes out of a single
+# sparse matrix-vector product instead of one /analyze-match call per job.
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on",
+    "or", "our", "the", "to", "we", "will", "with", "you", "your", "this", "that", "have", "has"
+}
+
+# Final score = weighted mix of skill coverage and text similarity
+SKILL_WEIGHT = 0.7
+TFIDF_WEIGHT = 0.3
+
+
+def tokenize(text):
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOP_WORDS]
+
+
+def _normalize_rows(matrix):
+    """L2-normalizes each row of a CSR matrix (rows of zeros stay zero)"""
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms) @ matrix
+
+
+def rank_jobs(resume_text, resume_skills, jobs, skill_matcher, required_skills_for=None, top_k=None):
+    """Ranks jobs for one resume.
+
+    jobs:                list of {"id", "title", "description"}
+    resume_skills:       skills already extracted from the resume
+    skill_matcher:       SkillMatcher used to find skills in each job's text
+    required_skills_for: optional fn(title) -> set of skills the role always needs
+    """
+    if not jobs:
+        return []
+
+    documents = [f"{job['title']}\n{job.get('description', '')}" for job in jobs]
+
+    # 1. Job x term matrix (raw counts), vocabulary built from the job corpus
+    vocabulary = {}
+    rows, cols = [], []
+    for row, document in enumerate(documents):
+        for token in tokenize(document):
+            rows.append(row)
+            cols.append(vocabulary.setdefault(token, len(vocabulary)))
+    counts = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(jobs), max(len(vocabulary), 1))
+    )
+    counts.sum_duplicates()
+
+    # Smoothed IDF, same formula as scikit-learn's TfidfVectorizer
+    document_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = np.log((1 + len(jobs)) / (1 + document_freq)) + 1
+    job_tfidf = _normalize_rows(counts @ sparse.diags(idf))
+
+    resume_vector = np.zeros(counts.shape[1])
+    for token in tokenize(resume_text):
+        col = vocabulary.get(token)
+        if col is not None:
+            resume_vector[col] += 1
+    resume_vector *= idf
+    norm = np.linalg.norm(resume_vector)
+    if norm:
+        resume_vector /= norm
+
+    # 2. Job x skill matrix (binary): skills named in the posting + the role's required skills
+    job_skill_sets = []
+    for job, document in zip(jobs, documents):
+        skills = skill_matcher.skills(document)
+        if required_skills_for:
+            skills |= set(required_skills_for(job["title"]))
+        job_skill_sets.append(skills)
+
+    skill_index = {}
+    rows, cols = [], []
+    for row, skills in enumerate(job_skill_sets):
+        for skill in skills:
+            rows.append(row)
+            cols.append(skill_index.setdefault(skill, len(skill_index)))
+    job_skills = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(jobs), max(len(skill_index), 1))
+    )
+
+    have = np.zeros(job_skills.shape[1])
+    for skill in resume_skills:
+        col = skill_index.get(skill)
+        if col is not None:
+            have[col] = 1
+
+    # 3. Score every job in one shot
+    similarity = job_tfidf @ resume_vector
+    required = np.asarray(job_skills.sum(axis=1)).ravel()
+    matched = job_skills @ have
+    # Jobs with no recognizable skills fall back to pure text similarity
+    coverage = np.divide(matched, required, out=similarity.copy(), where=required > 0)
+    scores = np.rint(100 * (SKILL_WEIGHT * coverage + TFIDF_WEIGHT * similarity)).astype(int)
+
+    order = np.argsort(-scores, kind="stable")
+    if top_k:
+        order = order[:top_k]
+
+    # Only the returned rows need their missing skills spelled out
+    skill_names = sorted(skill_index, key=skill_index.get)
+    missing = (job_skills @ sparse.diags(1 - have)).tocsr()
+
+    ranked = []
+    for row in order:
+        start, end = missing.indptr[row], missing.indptr[row + 1]
+        missing_skills = sorted(skill_names[c] for c, v in zip(missing.indices[start:end], missing.data[start:end]) if v)
+        ranked.append({
+            "id": jobs[row]["id"],
+            "title": jobs[row]["title"],
+            "match_score": int(scores[row]),
+            "skill_coverage": round(float(coverage[row]), 3),
+            "tfidf_similarity": round(float(similarity[row]), 3),
+            "missing_skills": missing_skills,
+        })
+    return ranked
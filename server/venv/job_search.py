@@ -0,0 +1,127 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+
+import httpx
+
+from metrics import ADZUNA_REQUESTS, span
+
+# ==========================================================
+# 🔍 ADZUNA JOB SEARCH CLIENT
+# ==========================================================
+# One pooled async HTTP client for the whole app (keep-alive, timeouts),
+# pages fetched concurrently, a TTL cache on normalized queries, and
+# coalescing so identical searches in flight share one upstream call.
+
+ADZUNA_URL = "https://api.adzuna.com/v1/api/jobs/in/search"
+MAX_PER_PAGE = 50  # Adzuna's upper limit for results_per_page
+
+
+def normalize_query(role, location="", company=""):
+    """("  Data  Scientist", "Pune ", "") -> ("data scientist", "pune", "")"""
+    return tuple(" ".join(part.lower().split()) for part in (role, location, company))
+
+
+class AdzunaClient:
+    def __init__(self, app_id, app_key, base_url=ADZUNA_URL, timeout=5.0, connect_timeout=2.0,
+                 max_connections=20, cache_ttl=300, cache_size=512):
+        self.app_id = app_id
+        self.app_key = app_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+
+        self._client = None
+        self._cache = OrderedDict()  # key -> (expires_at, results)
+        self._inflight = {}  # key -> asyncio.Task
+        self._stats = {"cache_hits": 0, "cache_misses": 0, "coalesced": 0, "upstream_calls": 0, "upstream_errors": 0}
+
+    @property
+    def client(self):
+        # Created lazily so it binds to the running event loop
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self):
+        return {**self._stats, "cache_entries": len(self._cache), "inflight": len(self._inflight)}
+
+    async def search(self, role, location="", company="", count=10):
+        """Returns up to `count` raw Adzuna result dicts (empty list if the API is unreachable)"""
+        key = normalize_query(role, location, company) + (count,)
+
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            self._stats["cache_hits"] += 1
+            return cached[1]
+        self._stats["cache_misses"] += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._stats["coalesced"] += 1
+
+        # shield: one caller disconnecting must not cancel the shared upstream call
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key):
+        role, location, company, count = key
+        per_page = min(count, MAX_PER_PAGE)
+        pages = math.ceil(count / per_page)
+
+        responses = await asyncio.gather(
+            *(self._fetch_page(page, role, location, company, per_page) for page in range(1, pages + 1))
+        )
+
+        results = []
+        for page_results in responses:
+            results.extend(page_results or [])
+        results = results[:count]
+
+        # Only cache complete answers, so an outage (even of one page) isn't remembered for the whole TTL
+        if all(page_results is not None for page_results in responses):
+            self._cache[key] = (time.monotonic() + self.cache_ttl, results)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return results
+
+    async def _fetch_page(self, page, role, location, company, per_page):
+        """Results of one page, or None if the page failed"""
+        params = {
+            "app_id": self.app_id,
+            "app_key": self.app_key,
+            "what": f"{role} {company}".strip(),
+            "where": location,
+            "results_per_page": per_page,
+            "content-type": "application/json"
+        }
+        self._stats["upstream_calls"] += 1
+        try:
+            with span("adzuna_call"):
+                response = await self.client.get(f"{self.base_url}/{page}", params=params)
+                if response.status_code == 200:
+                    results = response.json().get("results", [])
+                    ADZUNA_REQUESTS.inc(outcome="success")
+                    return results
+            print(f"Adzuna page {page} returned {response.status_code}")
+            ADZUNA_REQUESTS.inc(outcome=f"http_{response.status_code}")
+        except Exception as e:
+            # Anything goes here (timeouts, bad JSON, a body that isn't an object...): the
+            # caller falls back to demo jobs instead of failing the request
+            print(f"Adzuna page {page} failed: {e!r}")
+            ADZUNA_REQUESTS.inc(outcome="timeout" if isinstance(e, httpx.TimeoutException) else "error")
+        self._stats["upstream_errors"] += 1
+        return None
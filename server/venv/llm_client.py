@@ -0,0 +1,273 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+from metrics import LLM_ATTEMPTS, span
+
+# ==========================================================
+# 🤖 LLM CALL LAYER
+# ==========================================================
+# Wraps the Gemini models behind one async entry point:
+#   - the SDK is configured once, model objects are reused
+#   - each model has a circuit breaker, so dead / rate-limited models are skipped
+#   - the whole call has a latency budget (caller falls back to local logic)
+#   - answers are cached, identical in-flight requests share one call
+
+
+def is_rate_limit(error):
+    """Gemini raises google.api_core ResourceExhausted (HTTP 429) when throttled"""
+    text = f"{type(error).__name__} {error}"
+    return "ResourceExhausted" in text or "429" in text or "quota" in text.lower()
+
+
+class CircuitBreaker:
+    """closed -> (failures) -> open -> (cooldown) -> half-open -> closed / open"""
+
+    def __init__(self, failure_threshold=3, cooldown=30.0, rate_limit_cooldown=60.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.rate_limit_cooldown = rate_limit_cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self.successes = 0
+        self.total_failures = 0
+        self.probing = False  # half-open: one request is already trying the model
+
+    @property
+    def state(self):
+        if self.open_until == 0.0:
+            return "closed"
+        return "open" if time.monotonic() < self.open_until else "half-open"
+
+    def available(self):
+        state = self.state
+        return state == "closed" or (state == "half-open" and not self.probing)
+
+    def try_acquire(self):
+        """Call right before using the model. Half-open lets a single probe through;
+        its record_success / record_failure / release decides what happens next."""
+        if not self.available():
+            return False
+        if self.state == "half-open":
+            self.probing = True
+        return True
+
+    def release(self):
+        """Ends a probe that says nothing about the model (cut short by the budget, cancelled)"""
+        self.probing = False
+
+    def record_success(self):
+        self.successes += 1
+        self.failures = 0
+        self.open_until = 0.0
+        self.probing = False
+
+    def record_failure(self, rate_limited=False):
+        self.total_failures += 1
+        self.failures += 1
+        self.probing = False
+        if rate_limited:
+            # A 429 won't clear up on the next request, skip the model straight away
+            self.open_until = time.monotonic() + self.rate_limit_cooldown
+        elif self.failures >= self.failure_threshold or self.state == "half-open":
+            self.open_until = time.monotonic() + self.cooldown
+
+    def snapshot(self):
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "successes": self.successes,
+            "failures": self.total_failures,
+        }
+
+
+class GeminiBackend:
+    """Blocking call into google-generativeai: backend(model_name, prompt, timeout) -> text"""
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self._genai = None
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def _model(self, model_name):
+        with self._lock:
+            if self._genai is None:
+                # Imported here so the rest of the layer works with a fake backend alone
+                import google.generativeai as genai
+                genai.configure(api_key=self.api_key)
+                self._genai = genai
+            if model_name not in self._models:
+                self._models[model_name] = self._genai.GenerativeModel(model_name)
+            return self._models[model_name]
+
+    def __call__(self, model_name, prompt, timeout):
+        response = self._model(model_name).generate_content(prompt, request_options={"timeout": timeout})
+        return response.text
+
+    def stream(self, model_name, prompt, timeout):
+        """Yields text chunks as the model produces them"""
+        response = self._model(model_name).generate_content(prompt, stream=True, request_options={"timeout": timeout})
+        for chunk in response:
+            yield chunk.text
+
+
+class LLMClient:
+    def __init__(self, models, backend, budget=10.0, attempt_timeout=6.0, cache_size=256, cache_ttl=3600.0):
+        self.models = list(models)
+        self.backend = backend
+        self.budget = budget
+        self.attempt_timeout = attempt_timeout
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.breakers = {name: CircuitBreaker() for name in self.models}
+
+        self._cache = OrderedDict()  # key -> (expires_at, result)
+        self._inflight = {}  # key -> asyncio.Task
+        self._stats = {"cache_hits": 0, "coalesced": 0, "calls": 0, "budget_exhausted": 0, "all_models_down": 0}
+
+    def health(self):
+        return {
+            **self._stats,
+            "cache_entries": len(self._cache),
+            "models": {name: breaker.snapshot() for name, breaker in self.breakers.items()},
+        }
+
+    async def generate(self, key, prompt, parse):
+        """Runs `prompt` on the first healthy model and returns parse(text).
+
+        key:   hashable cache key, e.g. (resume_hash, job_hash, prompt_version)
+        parse: turns the raw model text into a result; raising counts as a model failure
+        Returns None when no model answered within the budget.
+        """
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            self._stats["cache_hits"] += 1
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate(key, prompt, parse))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    async def stream(self, key, prompt, parse, on_token):
+        """Like generate(), but calls `await on_token(model_name, text)` for every chunk.
+
+        A model that fails mid-stream is abandoned and the next one starts from
+        scratch, so callers should reset their buffer when model_name changes.
+        Cached answers are returned directly, without tokens.
+        """
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            self._stats["cache_hits"] += 1
+            return cached[1]
+
+        async def attempt(model_name, timeout):
+            return await self._stream_once(model_name, prompt, timeout, on_token)
+
+        return await self._run(key, parse, attempt)
+
+    async def _generate(self, key, prompt, parse):
+        async def attempt(model_name, timeout):
+            # The SDK is blocking: run it in a worker thread so the event loop stays free
+            return await asyncio.wait_for(asyncio.to_thread(self.backend, model_name, prompt, timeout), timeout)
+
+        return await self._run(key, parse, attempt)
+
+    async def _stream_once(self, model_name, prompt, timeout, on_token):
+        """Runs the backend's blocking stream in a thread and relays chunks through a queue"""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        stream = getattr(self.backend, "stream", None)
+
+        def produce():
+            try:
+                chunks = stream(model_name, prompt, timeout) if stream else [self.backend(model_name, prompt, timeout)]
+                for chunk in chunks:
+                    loop.call_soon_threadsafe(queue.put_nowait, ("token", chunk))
+                loop.call_soon_threadsafe(queue.put_nowait, ("end", None))
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, ("error", e))
+
+        loop.run_in_executor(None, produce)
+        deadline = time.monotonic() + timeout
+        parts = []
+        while True:
+            kind, value = await asyncio.wait_for(queue.get(), max(deadline - time.monotonic(), 0))
+            if kind == "error":
+                raise value
+            if kind == "end":
+                return "".join(parts)
+            parts.append(value)
+            await on_token(model_name, value)
+
+    async def _run(self, key, parse, attempt):
+        """Tries healthy models in order until one answers; `attempt(model, timeout)` returns its text"""
+        self._stats["calls"] += 1
+        deadline = time.monotonic() + self.budget
+
+        candidates = [name for name in self.models if self.breakers[name].available()]
+        for name in self.models:
+            if name not in candidates:
+                LLM_ATTEMPTS.inc(model=name, outcome="skipped_open_circuit")
+        if not candidates:
+            self._stats["all_models_down"] += 1
+            return None
+
+        for model_name in candidates:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._stats["budget_exhausted"] += 1
+                print("⌛ LLM budget exhausted")
+                return None
+
+            breaker = self.breakers[model_name]
+            if not breaker.try_acquire():
+                # Went open meanwhile, or another request is already probing it
+                LLM_ATTEMPTS.inc(model=model_name, outcome="skipped_open_circuit")
+                continue
+
+            timeout = min(self.attempt_timeout, remaining)
+            try:
+                print(f"⏳ Trying AI model: {model_name}...")
+                with span("llm_attempt", model=model_name):
+                    result = parse(await attempt(model_name, timeout))
+            except asyncio.TimeoutError:
+                if timeout < self.attempt_timeout:
+                    # The budget cut the attempt short: that says nothing about the model
+                    breaker.release()
+                    self._stats["budget_exhausted"] += 1
+                    LLM_ATTEMPTS.inc(model=model_name, outcome="budget_exhausted")
+                    print(f"⌛ LLM budget exhausted while waiting for {model_name}")
+                    return None
+                print(f"⌛ {model_name} timed out after {timeout:.1f}s")
+                LLM_ATTEMPTS.inc(model=model_name, outcome="timeout")
+                breaker.record_failure()
+                continue
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception as e:
+                print(f"❌ {model_name} failed: {e}")
+                rate_limited = is_rate_limit(e)
+                LLM_ATTEMPTS.inc(model=model_name, outcome="rate_limited" if rate_limited else "error")
+                breaker.record_failure(rate_limited=rate_limited)
+                continue
+
+            print(f"✅ AI Success!")
+            LLM_ATTEMPTS.inc(model=model_name, outcome="success")
+            breaker.record_success()
+            self._cache[key] = (time.monotonic() + self.cache_ttl, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return result
+
+        return None
@@ -0,0 +1,565 @@
+import os
+import json
+import hashlib
+import re
+import random
+import time
+import uuid
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Form, HTTPException, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+import uvicorn
+from skill_matcher import SkillMatcher
+from resume_cache import ParsedResumeCache, hash_file
+from job_ranker import rank_jobs
+from job_search import ADZUNA_URL, AdzunaClient
+from llm_client import GeminiBackend, LLMClient
+from pdf_extract import PdfExtractor
+from role_index import RoleIndex, load_roles
+from resume_index import ResumeIndex
+from metrics import ANALYSIS_RESULTS, render_metrics, span
+from analysis_jobs import JobScheduler, SchedulerFull
+from upload_stream import BadUpload, UploadTooLarge, stream_file_field
+
+@asynccontextmanager
+async def lifespan(app):
+    # load_app_state() and the clients it closes are defined further down
+    load_app_state()
+    yield
+    await ADZUNA.close()
+    await ANALYSIS_SCHEDULER.stop()
+    PDF_EXTRACTOR.shutdown()
+
+app = FastAPI(lifespan=lifespan)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# ==========================================================
+# 🔑 API KEYS (from the environment, see server/README.md)
+# ==========================================================
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+# ==========================================================
+
+# ADZUNA KEYS
+ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID", "")
+ADZUNA_APP_KEY = os.getenv("ADZUNA_APP_KEY", "")
+# Point at stub_adzuna.py for local testing
+ADZUNA_BASE_URL = os.getenv("ADZUNA_BASE_URL", ADZUNA_URL)
+MAX_SEARCH_RESULTS = 200
+
+# One pooled client for every search (keep-alive, timeouts, TTL cache)
+ADZUNA = AdzunaClient(ADZUNA_APP_ID, ADZUNA_APP_KEY, base_url=ADZUNA_BASE_URL)
+
+# ==========================================================
+# 🧠 LOCAL KNOWLEDGE BASE (THE FALLBACK BRAIN)
+# ==========================================================
+
+# 1. Master Skill List (For Regex Matching)
+ALL_SKILLS_DB = {
+    "python", "java", "c++", "c#", "javascript", "typescript", "react", "angular", "vue", "next.js",
+    "node.js", "express", "django", "flask", "fastapi", "spring", "springboot", "dotnet",
+    "sql", "mysql", "postgresql", "mongodb", "redis", "oracle", "nosql",
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "terraform", "ansible",
+    "git", "github", "gitlab", "ci/cd", "devops",
+    "machine learning", "deep learning", "nlp", "computer vision", "tensorflow", "pytorch", "scikit-learn", "pandas",
+    "html", "css", "tailwind", "bootstrap", "figma", "adobe xd",
+    "linux", "bash", "shell", "jira", "agile", "scrum", "kanban",
+    "networking", "tcp/ip", "dns", "firewall", "wireshark",
+    "selenium", "junit", "pytest", "cypress", "manual testing", "automation testing",
+    "tableau", "powerbi", "looker", "excel", "statistics", "probability"
+}
+
+# Alternative spellings that should count as the canonical skill
+SKILL_ALIASES = {
+    "k8s": "kubernetes", "postgres": "postgresql", "nodejs": "node.js", "reactjs": "react",
+    "nextjs": "next.js", "vuejs": "vue", "sklearn": "scikit-learn", "power bi": "powerbi",
+    "spring boot": "springboot", "ml": "machine learning", "dot net": "dotnet"
+}
+
+# 2. Job Role Definitions (Title Synonyms, Skills, Improvements, Roadmap)
+JOB_ROLES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_roles.json")
+JOB_ROLES_DATA = None  # loaded by load_app_state()
+
+# --- UPLOADS ---
+UPLOAD_DIR = "uploads"
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # boundaries and part headers around the file
+
+# --- HELPER FUNCTIONS ---
+# Bounded process pool; PDFs longer than 8 pages are split and extracted in parallel
+PDF_EXTRACTOR = PdfExtractor(pages_per_chunk=8)
+
+def extract_pages_from_pdf(file_path):
+    """Returns the text of each page (raises if the PDF can't be read). Blocking."""
+    return PDF_EXTRACTOR.extract_pages(file_path)
+
+# Compiled once at startup (load_app_state), then every resume is scanned in a single pass
+SKILL_MATCHER = None
+
+def extract_skills_from_text(text):
+    """Scans text for keywords in ALL_SKILLS_DB (whole words only, e.g. "C" won't match "Car")"""
+    return SKILL_MATCHER.skills(text)
+
+def find_skill_positions(text):
+    """Same scan as extract_skills_from_text, but returns {skill: [(start, end), ...]}"""
+    return SKILL_MATCHER.scan(text)
+
+# ==========================================================
+# 🗄️ PARSED RESUME CACHE
+# ==========================================================
+RESUME_CACHE = None
+
+# Every uploaded resume, searchable by skill (recruiter side); replays its log at startup
+RESUME_INDEX = None
+
+# Changes whenever the skill taxonomy changes, so cached skill sets get recomputed
+SKILLS_VERSION = hashlib.sha256(json.dumps([sorted(ALL_SKILLS_DB), sorted(SKILL_ALIASES.items())]).encode()).hexdigest()[:12]
+
+def resume_key(file_path):
+    """Content hash of a resume. Uploads are stored as uploads/<sha256>.pdf, so
+    for those it is taken from the name instead of re-reading the whole file."""
+    name = os.path.basename(file_path)
+    in_uploads = os.path.dirname(os.path.normpath(file_path)) == os.path.normpath(UPLOAD_DIR)
+    if in_uploads and re.fullmatch(r"[0-9a-f]{64}\.pdf", name):
+        return name[:-len(".pdf")]
+    return hash_file(file_path)
+
+def get_parsed_resume(file_path, key=None):
+    """Text, skills and page metadata for a resume, parsed at most once per file content"""
+    key = key or resume_key(file_path)
+    entry = RESUME_CACHE.get(key)
+
+    if entry is None:
+        try:
+            with span("pdf_extraction"):
+                pages = extract_pages_from_pdf(file_path)
+        except Exception as e:
+            # Don't cache failures, the next upload of this file should retry
+            print(f"Error reading PDF: {e}")
+            return {"hash": key, "text": "", "skills": [], "pages": []}
+
+        text = "".join(pages)
+        offset = 0
+        page_meta = []
+        for number, page_text in enumerate(pages, start=1):
+            page_meta.append({"page": number, "start": offset, "chars": len(page_text)})
+            offset += len(page_text)
+
+        with span("skill_extraction"):
+            skills = sorted(extract_skills_from_text(text))
+        entry = {
+            "hash": key,
+            "text": text,
+            "skills": skills,
+            "skills_version": SKILLS_VERSION,
+            "pages": page_meta,
+        }
+        RESUME_CACHE.put(key, entry)
+
+    elif entry.get("skills_version") != SKILLS_VERSION:
+        # Text is still valid, only the taxonomy moved on
+        entry = {**entry, "skills": sorted(extract_skills_from_text(entry["text"])), "skills_version": SKILLS_VERSION}
+        RESUME_CACHE.put(key, entry)
+
+    return entry
+
+# --- FALLBACK LOGIC ENGINE ---
+# Title synonyms -> role via an inverted index, required skills as bitmasks
+ROLE_INDEX = None
+
+def resolve_job_role(job_title):
+    """Maps a free-text job title to a key of JOB_ROLES_DATA (e.g. "Senior Full Stack Dev" -> "full-stack")"""
+    with span("role_resolution"):
+        return ROLE_INDEX.resolve(job_title, default="software engineer")
+
+def role_skills_for(job_title):
+    """Required skills of the role a title resolves to, for ranking jobs / resumes.
+
+    Unknown titles add nothing (no software-engineer default), and only skills
+    SKILL_MATCHER can find in a resume are kept, so a role skill is never
+    reported missing just because it can't be extracted.
+    """
+    with span("role_resolution"):
+        job_key = ROLE_INDEX.resolve(job_title)
+    if job_key is None:
+        return set()
+    return set(JOB_ROLES_DATA[job_key]["required"]) & ALL_SKILLS_DB
+
+def analyze_with_local_logic(resume_text, job_title, my_skills=None):
+    print(f"⚡ USING LOCAL LOGIC FOR: {job_title}")
+    
+    # 1. Identify Role
+    job_key = resolve_job_role(job_title)
+    role_data = JOB_ROLES_DATA[job_key]
+    
+    # 2. Extract Skills from Resume (skipped when the caller already has them cached)
+    if my_skills is None:
+        my_skills = extract_skills_from_text(resume_text)
+    skill_mask = ROLE_INDEX.vocabulary.mask(my_skills)
+    
+    # 3. Calculate Gap (required AND NOT have)
+    matched_count, required_count, missing_mask = ROLE_INDEX.score(job_key, skill_mask)
+    missing_skills = ROLE_INDEX.vocabulary.decode(missing_mask)
+    
+    # 4. Calculate Score
+    # Score = (Skills I Have / Skills Required) * 100
+    if required_count > 0:
+        score = int((matched_count / required_count) * 100)
+    else:
+        score = 50
+        
+    # Curve the score (Raw match is too harsh)
+    score = min(score + 30, 95) # Add base points for experience
+    
+    # 5. Format Output
+    return {
+        "match_score": score,
+        "missing_skills": missing_skills[:5], # Top 5 missing
+        "improvements": role_data["tips"],
+        "roadmap": role_data["roadmap"]
+    }
+
+# ==========================================================
+# 🤖 AI ANALYSIS (PLAN A)
+# ==========================================================
+# Try a robust list of models, in order of preference
+MODEL_OPTIONS = ['gemini-2.0-flash-lite-preview-02-05', 'gemini-flash-lite-latest', 'gemini-1.5-flash']
+
+# Bump when the prompt changes so cached AI answers are not reused
+PROMPT_VERSION = "v1"
+
+LLM = LLMClient(MODEL_OPTIONS, GeminiBackend(GEMINI_API_KEY), budget=10.0, attempt_timeout=6.0)
+
+def build_analysis_prompt(resume_text, job_title, job_desc):
+    return f"""
+                Act as an ATS. Compare Resume to Job.
+                RESUME: {resume_text[:4000]}
+                JOB TITLE: {job_title}
+                JOB DESC: {job_desc}
+                
+                Return raw JSON:
+                {{
+                    "match_score": 0,
+                    "missing_skills": ["Skill1", "Skill2"],
+                    "improvements": ["Tip1", "Tip2"],
+                    "roadmap": ["Step1", "Step2"]
+                }}
+                """
+
+def parse_ai_response(text):
+    clean_text = text.replace("```json", "").replace("```", "").strip()
+    return json.loads(clean_text)
+
+# ==========================================================
+# 🧵 ANALYSIS JOBS (POST -> job id, results over Server-Sent Events)
+# ==========================================================
+# 4 workers, at most 2 running jobs per user, identical pending jobs deduplicated
+ANALYSIS_SCHEDULER = JobScheduler(workers=4, per_user_limit=2, max_pending=200)
+
+async def stream_analysis(job, filename, job_title, job_desc):
+    """Job runner: local-logic result first, then LLM tokens, then the AI result"""
+    if not os.path.exists(filename):
+        local = local_fallback("", job_title)
+        job.emit("local_result", local)
+        return {"source": "local", "analysis": local}
+
+    parsed = await run_in_threadpool(get_parsed_resume, filename)
+    with span("local_preview"):
+        local = analyze_with_local_logic(parsed["text"], job_title, parsed["skills"])
+    job.emit("local_result", local)
+
+    current = {"model": None}
+
+    async def on_token(model_name, text):
+        # A new model means the previous one died mid-answer: clients drop what they have
+        if model_name != current["model"]:
+            current["model"] = model_name
+            job.emit("llm_start", {"model": model_name})
+        job.emit("token", {"text": text})
+
+    job_hash = hashlib.sha256(f"{job_title}\n{job_desc}".encode()).hexdigest()
+    prompt = build_analysis_prompt(parsed["text"], job_title, job_desc)
+    result = await LLM.stream((parsed["hash"], job_hash, PROMPT_VERSION), prompt, parse_ai_response, on_token)
+
+    if result is not None:
+        ANALYSIS_RESULTS.inc(source="ai")
+        job.emit("ai_result", result)
+        return {"source": "ai", "analysis": result}
+
+    ANALYSIS_RESULTS.inc(source="local")
+    job.emit("ai_unavailable", {})
+    return {"source": "local", "analysis": local}
+
+# ==========================================================
+# 🚀 STARTUP
+# ==========================================================
+# Everything that reads or writes disk is built here (called from lifespan)
+# rather than at import time: the PDF pool's worker processes (forkserver /
+# spawn) re-import this module, and must not replay the resume index or
+# create directories again.
+
+def load_app_state():
+    global JOB_ROLES_DATA, SKILL_MATCHER, RESUME_CACHE, RESUME_INDEX, ROLE_INDEX
+    JOB_ROLES_DATA = load_roles(JOB_ROLES_FILE)
+    SKILL_MATCHER = SkillMatcher(ALL_SKILLS_DB, SKILL_ALIASES)
+    RESUME_CACHE = ParsedResumeCache(cache_dir="resume_cache", max_entries=256)
+    RESUME_INDEX = ResumeIndex(log_path="resume_index.jsonl")
+    ROLE_INDEX = RoleIndex(JOB_ROLES_DATA, sorted(ALL_SKILLS_DB))
+
+    # Without keys the app still runs, just on local logic and demo jobs: say so loudly
+    if not GEMINI_API_KEY:
+        print("⚠️ GEMINI_API_KEY is not set: analyses will use local logic only")
+    if not (ADZUNA_APP_ID and ADZUNA_APP_KEY):
+        print("⚠️ ADZUNA_APP_ID / ADZUNA_APP_KEY are not set: job search will return demo jobs")
+
+# --- API ENDPOINTS ---
+
+@app.get("/")
+def home():
+    return {"status": "Gemini + Local Logic Brain Active 🧠"}
+
+@app.post("/search-jobs")
+async def find_jobs(role: str = Form(...), location: str = Form(""), company: str = Form(""), count: int = Form(10)):
+    # Timed as a whole, demo-jobs path included
+    with span("find_jobs"):
+        return await run_job_search(role, location, company, count)
+
+async def run_job_search(role, location, company, count):
+    results = []
+    if ADZUNA_APP_ID and ADZUNA_APP_KEY:
+        count = max(1, min(count, MAX_SEARCH_RESULTS))
+        found = await ADZUNA.search(role, location, company, count)
+        for item in found:
+            try:
+                results.append({
+                    "id": str(item.get('id')),
+                    "title": item.get('title').replace("<strong>", "").replace("</strong>", ""),
+                    "source": "Adzuna",
+                    "link": item.get('redirect_url'),
+                    "snippet": item.get('description')[:200] + "..."
+                })
+            except Exception:
+                pass
+            
+    # Fallback to Demo Jobs if API fails
+    if not results:
+        role_cap = role.title()
+        results = [
+            { "id": "demo_1", "title": f"Senior {role_cap} Developer", "source": "LinkedIn", "link": "#", "snippet": "Demo..." },
+            { "id": "demo_2", "title": f"{role_cap} Engineer", "source": "Naukri", "link": "#", "snippet": "Demo..." }
+        ]
+    return {"jobs": results}
+
+@app.post("/upload-resume")
+async def upload_resume(request: Request):
+    """Multipart upload with a `file` field. Parsed from the raw body as it arrives,
+    so oversized uploads are refused before they are received."""
+    # Stream to a temp file in chunks, hashing as we go, then move it to
+    # uploads/<sha256>.pdf so identical uploads share one file
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    tmp_path = os.path.join(UPLOAD_DIR, f"upload_{uuid.uuid4().hex}.part")
+    try:
+        with open(tmp_path, "wb") as f:
+            async def write(chunk):
+                nonlocal size
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise UploadTooLarge()
+                digest.update(chunk)
+                await run_in_threadpool(f.write, chunk)
+
+            original_name = await stream_file_field(request, "file", write, MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES)
+    except BaseException as e:
+        # Too large, client disconnected, disk full...: don't leave partial files behind
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        if isinstance(e, UploadTooLarge):
+            raise HTTPException(status_code=413, detail=f"Resume must be under {MAX_UPLOAD_BYTES // (1024 * 1024)} MB")
+        if isinstance(e, BadUpload):
+            raise HTTPException(status_code=400, detail=str(e))
+        raise
+
+    key = digest.hexdigest()
+    file_path = os.path.join(UPLOAD_DIR, f"{key}.pdf")
+    os.replace(tmp_path, file_path)
+
+    # Parse now so the first analysis only pays for the matching step
+    parsed = await run_in_threadpool(get_parsed_resume, file_path, key)
+
+    # Add to the recruiter-side corpus (unreadable PDFs have no pages and are skipped)
+    if parsed["pages"]:
+        await run_in_threadpool(RESUME_INDEX.add, key, parsed["skills"], original_name)
+    return {"filename": file_path, "message": "File uploaded", "pages": len(parsed["pages"])}
+
+@app.post("/search-resumes")
+def search_resumes(job_title: str = Form(...), job_desc: str = Form(""), top_k: int = Form(10)):
+    """Recruiter view: best stored resumes for a job title / description"""
+    required = role_skills_for(job_title) | extract_skills_from_text(f"{job_title}\n{job_desc}")
+    top_k = max(1, min(top_k, 100))
+
+    results = []
+    for resume_id, name, matched, missing in RESUME_INDEX.search(required, top_k):
+        results.append({
+            "resume_id": resume_id,
+            "name": name,
+            "match_score": int(len(matched) / len(required) * 100) if required else 0,
+            "matched_skills": matched,
+            "missing_skills": missing
+        })
+    return {"required_skills": sorted(required), "resumes": results, "corpus_size": len(RESUME_INDEX)}
+
+@app.delete("/resumes/{resume_id}")
+def delete_resume(resume_id: str):
+    if not RESUME_INDEX.delete(resume_id):
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return {"deleted": resume_id}
+
+@app.get("/cache-stats")
+def cache_stats():
+    return {
+        "resumes": RESUME_CACHE.stats(),
+        "job_search": ADZUNA.stats(),
+        "llm": LLM.health(),
+        "analysis_jobs": ANALYSIS_SCHEDULER.stats()
+    }
+
+@app.post("/rank-jobs")
+def rank_all_jobs(filename: str = Form(...), jobs: str = Form(...), top_k: int = Form(0)):
+    """Ranks every job for one resume in a single pass.
+
+    `jobs` is a JSON list: either the job objects returned by /search-jobs
+    or plain job description strings. `top_k` <= 0 returns every job.
+    """
+    try:
+        raw_jobs = json.loads(jobs)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="jobs must be a JSON list")
+    if not isinstance(raw_jobs, list):
+        raise HTTPException(status_code=400, detail="jobs must be a JSON list")
+
+    job_list = []
+    for i, item in enumerate(raw_jobs):
+        if isinstance(item, str):
+            # Pasted description: first line doubles as the title
+            title = item.strip().split("\n", 1)[0][:100]
+            job_list.append({"id": f"job_{i}", "title": title, "description": item})
+        elif isinstance(item, dict):
+            title = item.get("title") or ""
+            description = item.get("description") or item.get("snippet") or ""
+            if not isinstance(title, str) or not isinstance(description, str):
+                raise HTTPException(status_code=400, detail=f"jobs[{i}]: title and description must be strings")
+            job_list.append({"id": str(item.get("id", f"job_{i}")), "title": title, "description": description})
+        else:
+            raise HTTPException(status_code=400, detail=f"jobs[{i}] must be a string or an object")
+
+    if os.path.exists(filename):
+        parsed = get_parsed_resume(filename)
+    else:
+        parsed = {"text": "", "skills": []}
+
+    # top_k <= 0 means every job
+    ranked = rank_jobs(parsed["text"], parsed["skills"], job_list, SKILL_MATCHER, role_skills_for, top_k if top_k > 0 else None)
+    return {"jobs": ranked}
+
+@app.post("/analyze-match")
+async def analyze_match(filename: str = Form(...), job_title: str = Form(...), job_desc: str = Form(...)):
+    print(f"\n🧠 ANALYZING: {job_title}")
+    with span("analyze_match"):
+        return await run_analysis(filename, job_title, job_desc)
+
+async def run_analysis(filename, job_title, job_desc):
+    # 1. Read Resume
+    if not os.path.exists(filename):
+        return local_fallback("", job_title)
+    
+    parsed = await run_in_threadpool(get_parsed_resume, filename)
+    resume_text = parsed["text"]
+
+    # 2. TRY AI (PLAN A)
+    job_hash = hashlib.sha256(f"{job_title}\n{job_desc}".encode()).hexdigest()
+    prompt = build_analysis_prompt(resume_text, job_title, job_desc)
+    result = await LLM.generate((parsed["hash"], job_hash, PROMPT_VERSION), prompt, parse_ai_response)
+    if result is not None:
+        ANALYSIS_RESULTS.inc(source="ai")
+        return result
+
+    # 3. USE LOCAL LOGIC (PLAN B)
+    # If we are here, AI failed, was rate limited or ran out of time. Use Python logic.
+    return local_fallback(resume_text, job_title, parsed["skills"])
+
+def local_fallback(resume_text, job_title, my_skills=None):
+    ANALYSIS_RESULTS.inc(source="local")
+    with span("local_fallback"):
+        return analyze_with_local_logic(resume_text, job_title, my_skills)
+
+@app.post("/analysis-jobs")
+async def submit_analysis_job(request: Request, filename: str = Form(...), job_title: str = Form(...), job_desc: str = Form(...),
+                              client_id: str = Form(""), priority: str = Form("interactive")):
+    """Starts an analysis in the background and returns its id right away"""
+    resume_hash = await run_in_threadpool(resume_key, filename) if os.path.exists(filename) else filename
+    job_hash = hashlib.sha256(f"{job_title}\n{job_desc}".encode()).hexdigest()
+    user = client_id or (request.client.host if request.client else "anonymous")
+
+    async def runner(job):
+        # Same total as /analyze-match, measured from when a worker picks the job up
+        with span("analyze_match"):
+            return await stream_analysis(job, filename, job_title, job_desc)
+
+    try:
+        job, deduplicated = ANALYSIS_SCHEDULER.submit((resume_hash, job_hash), user, runner, priority)
+    except SchedulerFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "deduplicated": deduplicated,
+        "events_url": f"/analysis-jobs/{job.id}/events"
+    }
+
+@app.get("/analysis-jobs/{job_id}")
+def get_analysis_job(job_id: str):
+    job = ANALYSIS_SCHEDULER.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+    return job.snapshot()
+
+@app.get("/analysis-jobs/{job_id}/events")
+async def analysis_job_events(job_id: str, request: Request):
+    """Server-Sent Events: queued, started, local_result, llm_start, token..., ai_result | ai_unavailable, done | error"""
+    job = ANALYSIS_SCHEDULER.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+
+    # EventSource sends Last-Event-ID when it reconnects: resume after it
+    last_event_id = request.headers.get("last-event-id", "")
+    after = int(last_event_id) if last_event_id.isdigit() else -1
+
+    async def event_stream():
+        async for event in job.subscribe(after):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            event_id, name, data = event
+            yield f"id: {event_id}\nevent: {name}\ndata: {json.dumps(data)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.get("/metrics")
+def metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+if __name__ == "__main__":
+    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
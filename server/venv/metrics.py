@@ -0,0 +1,120 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# ==========================================================
+# 📊 METRICS (PROMETHEUS TEXT FORMAT)
+# ==========================================================
+# Minimal counters / histograms with labels, rendered in the Prometheus text
+# exposition format for GET /metrics. Stages are timed with:
+#
+#     with span("pdf_extraction"):
+#         ...
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_REGISTRY = []
+_lock = threading.Lock()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class Counter:
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        _REGISTRY.append(self)
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(labels.get(name, "") for name in self.labelnames), 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # labels -> [bucket counts..., sum, count]
+        _REGISTRY.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with _lock:
+            series = self._series.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, series in sorted(self._series.items()):
+            for bound, count in zip(self.buckets, series):
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', bound)])} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, [('le', '+Inf')])} {series[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {series[-2]}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {series[-1]}")
+        return lines
+
+
+def render_metrics():
+    with _lock:
+        lines = []
+        for metric in _REGISTRY:
+            lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# --- The app's metrics ---
+STAGE_LATENCY = Histogram(
+    "resumematch_stage_latency_seconds", "Time spent in each request stage", ["stage", "model"]
+)
+STAGE_ERRORS = Counter(
+    "resumematch_stage_errors_total", "Stages that ended with an exception", ["stage", "model"]
+)
+ANALYSIS_RESULTS = Counter(
+    "resumematch_analysis_total", "Finished analyses by who answered (ai or local fallback)", ["source"]
+)
+LLM_ATTEMPTS = Counter(
+    "resumematch_llm_attempts_total", "Gemini calls by model and outcome", ["model", "outcome"]
+)
+ADZUNA_REQUESTS = Counter(
+    "resumematch_adzuna_requests_total", "Adzuna page requests by outcome", ["outcome"]
+)
+
+
+@contextmanager
+def span(stage, model=""):
+    """Times the block into STAGE_LATENCY; exceptions are counted and re-raised"""
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        STAGE_ERRORS.inc(stage=stage, model=model)
+        raise
+    finally:
+        STAGE_LATENCY.observe(time.perf_counter() - start, stage=stage, model=model)
@@ -0,0 +1,69 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from pypdf import PdfReader
+
+# ==========================================================
+# 📄 PDF TEXT EXTRACTION (PROCESS POOL)
+# ==========================================================
+# pypdf is pure Python and holds the GIL while it decodes content streams, so
+# extraction runs in a small process pool instead of the server's threads.
+# Long PDFs are cut into page ranges that are extracted in parallel.
+
+
+def _extract_range(file_path, start, end):
+    """Worker: text of pages [start, end). Runs in a child process."""
+    reader = PdfReader(file_path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, end)]
+
+
+def _pool_context():
+    # Forking a multi-threaded server can copy a lock some other thread holds and
+    # deadlock the child, so never fork: forkserver where it exists, else spawn (Windows)
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    ctx = multiprocessing.get_context("forkserver")
+    # The default preload is __main__, i.e. the whole server; workers only need this module
+    ctx.set_forkserver_preload(["pdf_extract"])
+    return ctx
+
+
+def count_pages(file_path):
+    # Only walks the page tree, no content streams are decoded
+    return len(PdfReader(file_path).pages)
+
+
+class PdfExtractor:
+    def __init__(self, max_workers=None, pages_per_chunk=8):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.pages_per_chunk = pages_per_chunk
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self):
+        # Started on first use: spawning children at import time breaks on Windows
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=_pool_context())
+            return self._pool
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def extract_pages(self, file_path):
+        """Returns the text of each page. Blocking: call it from a worker thread."""
+        total = count_pages(file_path)
+        futures = [
+            self.pool.submit(_extract_range, file_path, start, min(start + self.pages_per_chunk, total))
+            for start in range(0, total, self.pages_per_chunk)
+        ]
+        pages = []
+        for future in futures:
+            pages.extend(future.result())
+        return pages
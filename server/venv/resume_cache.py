@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+
+# ==========================================================
+# 🗄️ PARSED RESUME CACHE
+# ==========================================================
+# Keyed by the SHA-256 of the file contents, so the same PDF uploaded twice
+# (or under another name) is only parsed once. Hot entries live in a bounded
+# in-memory LRU; every entry is also written to disk so restarts stay warm.
+
+
+def hash_file(file_path, chunk_size=1 << 16):
+    """SHA-256 of a file's contents, read in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParsedResumeCache:
+    """Two-level (memory LRU + disk) store for parsed resume entries (plain JSON-able dicts)"""
+
+    def __init__(self, cache_dir="resume_cache", max_entries=256):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "writes": 0}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remember(self, key, entry):
+        """Insert into the LRU (caller holds the lock)"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return self._memory[key]
+
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+
+        with self._lock:
+            self._stats["disk_hits"] += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        # Write to a temp file first so a crash never leaves a half-written entry.
+        # Unique per write: two threads caching the same key must not share it.
+        tmp_path = f"{self._path(key)}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"Error writing resume cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        with self._lock:
+            self._stats["writes"] += 1
+            self._remember(key, entry)
+
+    def stats(self):
+        with self._lock:
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "hits": hits,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+            }
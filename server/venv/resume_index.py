@@ -0,0 +1,141 @@
+import heapq
+import json
+import os
+import threading
+from collections import defaultdict
+
+# ==========================================================
+# 🧑‍💼 RESUME CORPUS (INVERTED SKILL INDEX)
+# ==========================================================
+# skill -> set of internal resume ids. A recruiter query only walks the
+# posting lists of the job's skills, rarest first, and stops pulling new
+# resumes in as soon as no unseen resume could still make the top k.
+#
+# Persisted as an append-only JSONL log of add/delete operations that is
+# replayed on startup and compacted when it grows too large.
+
+
+class ResumeIndex:
+    def __init__(self, log_path="resume_index.jsonl"):
+        self.log_path = log_path
+        self.postings = defaultdict(set)  # skill -> {doc_id}
+        self.docs = {}  # doc_id -> {"resume_id", "name", "skills"}
+        self.doc_ids = {}  # resume_id (content hash) -> doc_id
+        self._next_id = 0
+        self._log_lines = 0
+        self._lock = threading.Lock()
+        self._replay()
+
+    def __len__(self):
+        return len(self.docs)
+
+    # --- persistence ---
+    def _replay(self):
+        if not os.path.exists(self.log_path):
+            return
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    continue  # torn last line after a crash
+                self._log_lines += 1
+                if op["op"] == "add":
+                    self._add(op["resume_id"], op["skills"], op.get("name", ""))
+                elif op["op"] == "delete":
+                    self._delete(op["resume_id"])
+
+    def _append(self, op):
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(op) + "\n")
+        self._log_lines += 1
+        # Mostly dead lines (re-uploads, deletes): rewrite the log from live docs
+        if self._log_lines > 2 * len(self.docs) + 1000:
+            self._compact()
+
+    def _compact(self):
+        tmp_path = self.log_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for doc in self.docs.values():
+                f.write(json.dumps({"op": "add", "resume_id": doc["resume_id"],
+                                    "name": doc["name"], "skills": sorted(doc["skills"])}) + "\n")
+        os.replace(tmp_path, self.log_path)
+        self._log_lines = len(self.docs)
+
+    # --- updates ---
+    def _add(self, resume_id, skills, name):
+        self._delete(resume_id)
+        doc_id = self._next_id
+        self._next_id += 1
+        skills = set(skills)
+        self.docs[doc_id] = {"resume_id": resume_id, "name": name, "skills": skills}
+        self.doc_ids[resume_id] = doc_id
+        for skill in skills:
+            self.postings[skill].add(doc_id)
+
+    def _delete(self, resume_id):
+        doc_id = self.doc_ids.pop(resume_id, None)
+        if doc_id is None:
+            return False
+        for skill in self.docs.pop(doc_id)["skills"]:
+            posting = self.postings[skill]
+            posting.discard(doc_id)
+            if not posting:
+                del self.postings[skill]
+        return True
+
+    def add(self, resume_id, skills, name=""):
+        """Indexes (or re-indexes) a resume under its content hash"""
+        with self._lock:
+            self._add(resume_id, skills, name)
+            self._append({"op": "add", "resume_id": resume_id, "name": name, "skills": sorted(skills)})
+
+    def delete(self, resume_id):
+        with self._lock:
+            if not self._delete(resume_id):
+                return False
+            self._append({"op": "delete", "resume_id": resume_id})
+            return True
+
+    # --- queries ---
+    def search(self, required_skills, k=10):
+        """Top-k resumes by number of required skills they have.
+
+        Returns [(resume_id, name, matched_skills, missing_skills)], best first.
+        """
+        required = set(required_skills)
+        with self._lock:
+            lists = sorted((self.postings[s] for s in required if s in self.postings), key=len)
+
+            # Phase 1: count matches list by list, rarest skill first. counts[doc]
+            # is a lower bound on how many of the required skills the doc has.
+            counts = defaultdict(int)
+            scanned = 0
+            for posting in lists:
+                # A resume not seen yet can appear in at most the lists that are left.
+                # Once k seen resumes already match more than that, it can't make the top k.
+                # (Equal isn't enough: it could tie and win the tie by being indexed earlier.)
+                if len(counts) >= k and heapq.nlargest(k, counts.values())[-1] > len(lists) - scanned:
+                    break
+                for doc_id in posting:
+                    counts[doc_id] += 1
+                scanned += 1
+
+            # Phase 2: finish the skipped (largest) lists by membership probes, only
+            # for resumes that could still reach the k-th best if they hit every one
+            for j in range(scanned, len(lists)):
+                floor = heapq.nlargest(k, counts.values())[-1] - (len(lists) - j)
+                counts = {d: c for d, c in counts.items() if c >= floor}
+                posting = lists[j]
+                for doc_id in counts:
+                    if doc_id in posting:
+                        counts[doc_id] += 1
+
+            # counts are exact now; ties go to the resume indexed first
+            top = heapq.nsmallest(k, counts.items(), key=lambda item: (-item[1], item[0]))
+            docs = [self.docs[doc_id] for doc_id, _ in top]
+
+            return [
+                (doc["resume_id"], doc["name"], sorted(doc["skills"] & required), sorted(required - doc["skills"]))
+                for doc in docs
+            ]
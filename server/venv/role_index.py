@@ -0,0 +1,177 @@
+import json
+import math
+import re
+from collections import defaultdict
+
+# ==========================================================
+# 🗂️ ROLE INDEX (TITLE RESOLUTION + BITMASK SKILL SCORING)
+# ==========================================================
+# Job titles are resolved first by exact synonym phrases found in the title,
+# then through a token-level inverted index over every role's synonyms,
+# scoring how much of each synonym the title covers (rare tokens like
+# "stack" count more than "engineer"). Required skills are
+# stored as int bitmasks over a shared skill vocabulary, so gap detection is
+# `required & ~have` and the match count is a popcount.
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+# Spelling variants folded into one token sequence before indexing / lookup
+TOKEN_EXPANSIONS = {
+    "fullstack": ["full", "stack"],
+    "frontend": ["front", "end"],
+    "backend": ["back", "end"],
+    "cybersecurity": ["cyber", "security"],
+    "dev": ["developer"],
+    "devs": ["developer"],
+    "developers": ["developer"],
+    "eng": ["engineer"],
+    "engg": ["engineer"],
+    "engineers": ["engineer"],
+}
+
+# A title must cover at least this share of a synonym's weight to resolve to it
+MIN_COVERAGE = 0.6
+
+# Tokens in more synonyms than this ("engineer", "developer") don't generate
+# candidates on their own, they only add weight to candidates found otherwise
+COMMON_POSTINGS = 256
+
+
+def tokenize_title(title):
+    tokens = []
+    for token in TOKEN_PATTERN.findall(title.lower()):
+        tokens.extend(TOKEN_EXPANSIONS.get(token, [token]))
+    return tokens
+
+
+def load_roles(path):
+    """Reads a roles JSON file: {role: {"synonyms", "required", "roadmap", "tips"}}"""
+    with open(path, "r", encoding="utf-8") as f:
+        roles = json.load(f)
+    for role in roles.values():
+        role["required"] = set(role["required"])
+        role.setdefault("synonyms", [])
+    return roles
+
+
+class SkillVocabulary:
+    """Assigns every skill a bit position"""
+
+    def __init__(self, skills=()):
+        self.bit = {}
+        self.names = []
+        for skill in skills:
+            self.add(skill)
+
+    def add(self, skill):
+        if skill not in self.bit:
+            self.bit[skill] = len(self.names)
+            self.names.append(skill)
+        return self.bit[skill]
+
+    def mask(self, skills):
+        """Bitmask of the known skills in `skills` (unknown ones are ignored)"""
+        mask = 0
+        for skill in skills:
+            bit = self.bit.get(skill)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def decode(self, mask):
+        """Skill names for the set bits, in vocabulary order"""
+        names = []
+        while mask:
+            low = mask & -mask
+            names.append(self.names[low.bit_length() - 1])
+            mask ^= low
+        return names
+
+
+class RoleIndex:
+    def __init__(self, roles, skills=()):
+        """roles: {key: {"synonyms": [...], "required": {...}, ...}}"""
+        self.roles = list(roles)
+        self.vocabulary = SkillVocabulary(skills)
+
+        # 1. Required skills as bitmasks (the vocabulary grows to cover role-only skills)
+        self.required_masks = {}
+        for key, role in roles.items():
+            for skill in sorted(role["required"]):
+                self.vocabulary.add(skill)
+        for key, role in roles.items():
+            self.required_masks[key] = self.vocabulary.mask(role["required"])
+
+        # 2. Every synonym (the role key itself included) becomes one indexed "document"
+        self.synonym_role = []
+        self.synonym_tokens = []
+        self.phrases = {}  # exact token sequence -> synonym id (first one in file order wins)
+        for key, role in roles.items():
+            for phrase in [key] + list(role["synonyms"]):
+                tokens = tokenize_title(phrase)
+                if tokens:
+                    self.phrases.setdefault(tuple(tokens), len(self.synonym_role))
+                    self.synonym_role.append(key)
+                    self.synonym_tokens.append(set(tokens))
+        self.max_phrase = max((len(p) for p in self.phrases), default=0)
+
+        document_freq = defaultdict(int)
+        for tokens in self.synonym_tokens:
+            for token in tokens:
+                document_freq[token] += 1
+        total = len(self.synonym_tokens)
+        self.idf = {token: math.log(1 + total / df) for token, df in document_freq.items()}
+
+        self.postings = defaultdict(list)
+        self.synonym_weight = []
+        for synonym_id, tokens in enumerate(self.synonym_tokens):
+            for token in tokens:
+                self.postings[token].append(synonym_id)
+            self.synonym_weight.append(sum(self.idf[t] for t in tokens))
+
+    @classmethod
+    def from_file(cls, path, skills=()):
+        return cls(load_roles(path), skills)
+
+    def resolve(self, title, default=None):
+        """Best matching role key for a free-text title (or `default` when nothing fits)"""
+        tokens = tokenize_title(title)
+
+        # Fast path: a synonym appears verbatim in the title ("Senior [full stack developer]").
+        # Several can: the most specific (heaviest) one wins, then file order.
+        best, best_rank = None, None
+        for start in range(len(tokens)):
+            for end in range(start + 1, min(start + self.max_phrase, len(tokens)) + 1):
+                synonym_id = self.phrases.get(tuple(tokens[start:end]))
+                if synonym_id is not None:
+                    rank = (self.synonym_weight[synonym_id], -synonym_id)
+                    if best_rank is None or rank > best_rank:
+                        best, best_rank = synonym_id, rank
+        if best is not None:
+            return self.synonym_role[best]
+
+        # Slow path: partial, order-free overlap ("Engineer, Site Reliability").
+        # Candidates come from the posting lists of the title's rarer tokens.
+        title_tokens = {t for t in tokens if t in self.idf}
+        candidates = set()
+        for token in title_tokens:
+            postings = self.postings[token]
+            if len(postings) <= COMMON_POSTINGS:
+                candidates.update(postings)
+
+        for synonym_id in candidates:
+            weight = sum(self.idf[t] for t in self.synonym_tokens[synonym_id] & title_tokens)
+            coverage = weight / self.synonym_weight[synonym_id]
+            if coverage < MIN_COVERAGE:
+                continue
+            # Most fully covered synonym first, then the more specific one, then file order
+            rank = (coverage, weight, -synonym_id)
+            if best_rank is None or rank > best_rank:
+                best, best_rank = synonym_id, rank
+
+        return self.synonym_role[best] if best is not None else default
+
+    def score(self, role_key, skill_mask):
+        """(matched_count, required_count, missing_mask) for a resume's skill bitmask"""
+        required = self.required_masks[role_key]
+        return (required & skill_mask).bit_count(), required.bit_count(), required & ~skill_mask
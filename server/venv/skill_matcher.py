@@ -0,0 +1,112 @@
+import re
+from collections import defaultdict
+
+# ==========================================================
+# 🔎 SINGLE-PASS SKILL MATCHER
+# ==========================================================
+# All skill names (and their aliases) are folded into one character trie,
+# which is turned into a single regex. The regex is compiled once and the
+# resume is scanned in one pass, instead of one re.search() per skill.
+#
+# "Whole word" means: the skill is not glued to a letter/digit/underscore on
+# either side. Unlike r'\b' + skill + r'\b', this also works for skills that
+# start or end with punctuation such as "c++", "c#", "ci/cd" or "next.js".
+
+
+def _normalize(surface):
+    """Lowercase and collapse internal whitespace ("Machine  Learning" -> "machine learning")"""
+    return " ".join(surface.lower().split())
+
+
+def _trie_to_regex(node):
+    """Turns a nested dict trie into a compact regex (shared prefixes are only written once)"""
+    terminal = "" in node
+    branches = []
+    for char in sorted(k for k in node if k != ""):
+        # A space inside a skill matches any run of whitespace (PDF line breaks, double spaces)
+        head = r"\s+" if char == " " else re.escape(char)
+        branches.append(head + _trie_to_regex(node[char]))
+
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+
+    body = "(?:" + "|".join(branches) + ")"
+    # Greedy optional group: the longest skill wins, the regex backtracks if the boundary fails
+    return body + "?" if terminal else body
+
+
+class SkillMatcher:
+    """Compiled-once matcher for a skill taxonomy.
+
+    skills:  iterable of canonical skill names
+    aliases: optional {alias: canonical} map, e.g. {"k8s": "kubernetes"}
+    """
+
+    def __init__(self, skills, aliases=None):
+        # surface form (what appears in text) -> canonical skill
+        self.canonical = {}
+        for skill in skills:
+            self.canonical[_normalize(skill)] = _normalize(skill)
+        for alias, skill in (aliases or {}).items():
+            self.canonical[_normalize(alias)] = _normalize(skill)
+
+        trie = {}
+        for surface in self.canonical:
+            node = trie
+            for char in surface:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        # The regex reports the longest surface at each start position. Shorter
+        # surfaces that end on a word boundary inside it ("machine" inside
+        # "machine learning") are resolved from this table instead.
+        self.nested = defaultdict(list)
+        for surface in self.canonical:
+            for end in range(1, len(surface)):
+                prefix = surface[:end]
+                if prefix in self.canonical and not self._is_word(surface[end - 1], surface[end]):
+                    self.nested[surface].append(prefix)
+
+        # Zero-width lookahead so overlapping matches starting at different
+        # positions ("learning" inside "machine learning") are all reported.
+        body = _trie_to_regex(trie) if trie else r"(?!)"
+        self.pattern = re.compile(r"(?<!\w)(?=(" + body + r")(?!\w))", re.IGNORECASE)
+
+    @staticmethod
+    def _is_word(left, right):
+        """True if the boundary between two chars sits inside a word (both are \\w)"""
+        return (left.isalnum() or left == "_") and (right.isalnum() or right == "_")
+
+    def scan(self, text):
+        """Returns {canonical_skill: [(start, end), ...]} with positions into `text`"""
+        positions = defaultdict(list)
+        for m in self.pattern.finditer(text):
+            start = m.start(1)
+            surface = _normalize(m.group(1))
+            positions[self.canonical[surface]].append((start, m.end(1)))
+            for prefix in self.nested.get(surface, ()):
+                positions[self.canonical[prefix]].append((start, start + self._span(m.group(1), len(prefix))))
+        return dict(positions)
+
+    @staticmethod
+    def _span(matched, length):
+        """Maps a length in the normalized surface back to a length in the raw matched text"""
+        seen = 0
+        in_space = False
+        for i, char in enumerate(matched):
+            if seen == length:
+                return i
+            if not (char.isspace() and in_space):
+                seen += 1
+            in_space = char.isspace()
+        return len(matched)
+
+    def counts(self, text):
+        """Returns {canonical_skill: number_of_occurrences}"""
+        return {skill: len(spans) for skill, spans in self.scan(text).items()}
+
+    def skills(self, text):
+        """Returns the set of canonical skills present in text"""
+        return set(self.scan(text))
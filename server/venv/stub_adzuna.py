@@ -0,0 +1,86 @@
+"""Local stand-in for the Adzuna search API, for testing find_jobs offline.
+
+Run:   python stub_adzuna.py --port 8765 --latency 0.2 --error-rate 0.1
+Then:  ADZUNA_BASE_URL=http://127.0.0.1:8765/v1/api/jobs/in/search python main.py
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+TOTAL_RESULTS = 500
+
+
+class StubAdzunaHandler(BaseHTTPRequestHandler):
+    latency = 0.0      # seconds added to every response
+    error_rate = 0.0   # fraction of requests answered with HTTP 500
+    calls = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with StubAdzunaHandler.lock:
+            StubAdzunaHandler.calls += 1
+
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        try:
+            page = int(url.path.rstrip("/").rsplit("/", 1)[-1])
+        except ValueError:
+            return self._send(404, {"error": "no page"})
+
+        if self.latency:
+            time.sleep(self.latency)
+        if random.random() < self.error_rate:
+            return self._send(500, {"error": "injected failure"})
+
+        per_page = int(query.get("results_per_page", 10))
+        what = query.get("what", "developer").strip() or "developer"
+        first = (page - 1) * per_page
+        results = [
+            {
+                "id": 100000 + i,
+                "title": f"<strong>{what.title()}</strong> #{i}",
+                "redirect_url": f"https://example.com/jobs/{i}",
+                "description": f"Looking for a {what} with python, sql, docker and git experience. " * 4
+            }
+            for i in range(first, min(first + per_page, TOTAL_RESULTS))
+        ]
+        self._send(200, {"count": TOTAL_RESULTS, "results": results})
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass  # keep test output quiet
+
+
+def start_stub(port=0, latency=0.0, error_rate=0.0):
+    """Starts the stub in a background thread, returns (server, base_url)"""
+    StubAdzunaHandler.latency = latency
+    StubAdzunaHandler.error_rate = error_rate
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubAdzunaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1/api/jobs/in/search"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, base_url = start_stub(args.port, args.latency, args.error_rate)
+    print(f"Stub Adzuna listening on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
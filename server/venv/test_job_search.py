@@ -0,0 +1,146 @@
+"""AdzunaClient against the local stub (stub_adzuna.py). Run with: python -m pytest test_job_search.py"""
+import asyncio
+import itertools
+import time
+
+import httpx
+import pytest
+
+import stub_adzuna
+from job_search import AdzunaClient
+from stub_adzuna import StubAdzunaHandler, start_stub
+
+
+@pytest.fixture
+def stub():
+    """Starts a stub per test and returns a function that (re)configures it"""
+    servers = []
+
+    def configure(latency=0.0, error_rate=0.0):
+        if not servers:
+            servers.append(start_stub(latency=latency, error_rate=error_rate))
+        StubAdzunaHandler.latency = latency
+        StubAdzunaHandler.error_rate = error_rate
+        return servers[0][1]
+
+    StubAdzunaHandler.calls = 0
+    yield configure
+    for server, _ in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def run(client, coro):
+    """Runs one test body on a fresh loop, closing the pooled client before the loop goes away"""
+    async def body():
+        try:
+            return await coro
+        finally:
+            await client.close()
+
+    return asyncio.run(body())
+
+
+def test_pages_are_fetched_and_joined(stub):
+    client = AdzunaClient("id", "key", base_url=stub())
+    results = run(client, client.search("Data Engineer", "Pune", count=120))
+
+    assert len(results) == 120
+    assert len({r["id"] for r in results}) == 120
+    assert StubAdzunaHandler.calls == 3  # 50 + 50 + 20
+
+
+def test_repeat_query_is_served_from_cache(stub):
+    client = AdzunaClient("id", "key", base_url=stub())
+
+    async def body():
+        first = await client.search("Data Engineer", "Pune")
+        # Same query after normalization (case, extra spaces)
+        second = await client.search("  data   ENGINEER", "pune ")
+        return first, second
+
+    first, second = run(client, body())
+    assert first == second
+    assert StubAdzunaHandler.calls == 1
+    assert client.stats()["cache_hits"] == 1
+
+
+def test_cache_entries_expire_after_ttl(stub):
+    client = AdzunaClient("id", "key", base_url=stub(), cache_ttl=0.05)
+
+    async def body():
+        await client.search("python developer")
+        await asyncio.sleep(0.1)
+        await client.search("python developer")
+
+    run(client, body())
+    assert StubAdzunaHandler.calls == 2
+
+
+def test_identical_searches_in_flight_share_one_upstream_call(stub):
+    client = AdzunaClient("id", "key", base_url=stub(latency=0.2))
+
+    async def body():
+        return await asyncio.gather(*(client.search("java developer", count=100) for _ in range(5)))
+
+    responses = run(client, body())
+    assert all(r == responses[0] and len(r) == 100 for r in responses)
+    assert StubAdzunaHandler.calls == 2  # one call per page, not per caller
+    assert client.stats()["coalesced"] == 4
+
+
+def test_pages_run_concurrently(stub):
+    client = AdzunaClient("id", "key", base_url=stub(latency=0.2))
+
+    start = time.perf_counter()
+    results = run(client, client.search("devops", count=200))
+    elapsed = time.perf_counter() - start
+
+    assert len(results) == 200
+    assert elapsed < 0.6  # 4 pages of 0.2s each would take 0.8s one after the other
+
+
+def test_timeout_returns_empty_and_is_not_cached(stub):
+    base_url = stub(latency=0.5)
+    client = AdzunaClient("id", "key", base_url=base_url, timeout=0.1)
+
+    assert run(client, client.search("sre")) == []
+    assert client.stats()["upstream_errors"] == 1
+    assert client.stats()["cache_entries"] == 0
+
+    stub(latency=0.0)
+    assert len(run(client, client.search("sre"))) == 10
+
+
+def test_injected_errors_are_not_cached(stub):
+    client = AdzunaClient("id", "key", base_url=stub(error_rate=1.0))
+    assert run(client, client.search("qa engineer")) == []
+
+    stub(error_rate=0.0)
+    assert len(run(client, client.search("qa engineer"))) == 10
+    assert StubAdzunaHandler.calls == 2
+
+
+def test_partial_failure_is_returned_but_not_cached(stub, monkeypatch):
+    # Exactly one of the four pages fails, whichever is served first
+    draws = itertools.chain([0.0], itertools.repeat(1.0))
+    monkeypatch.setattr(stub_adzuna.random, "random", lambda: next(draws))
+    client = AdzunaClient("id", "key", base_url=stub(error_rate=0.5))
+
+    assert len(run(client, client.search("data analyst", count=200))) == 150
+    assert client.stats()["cache_entries"] == 0
+
+    monkeypatch.undo()
+    stub(error_rate=0.0)
+    assert len(run(client, client.search("data analyst", count=200))) == 200
+    assert client.stats()["cache_entries"] == 1
+
+
+def test_unexpected_response_body_counts_as_a_failed_page():
+    # A 200 whose JSON is not an object used to escape as AttributeError
+    client = AdzunaClient("id", "key", base_url="http://adzuna.test")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=["oops"])))
+
+    assert run(client, client.search("frontend")) == []
+    assert client.stats()["upstream_errors"] == 1
+    assert client.stats()["cache_entries"] == 0
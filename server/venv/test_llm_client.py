@@ -0,0 +1,199 @@
+"""LLMClient against the fake model backend (fake_llm.py). Run with: python -m pytest test_llm_client.py"""
+import asyncio
+import json
+import time
+
+from fake_llm import FakeModelBackend
+from llm_client import CircuitBreaker, LLMClient
+
+
+def parse(text):
+    return json.loads(text.replace("```json", "").replace("```", "").strip())
+
+
+def make_client(behaviours=None, models=("model-a", "model-b"), **kwargs):
+    backend = FakeModelBackend(behaviours)
+    return LLMClient(models, backend, **kwargs), backend
+
+
+def answered_by(result):
+    return result["improvements"][0].rsplit(" ", 1)[-1]
+
+
+def test_first_healthy_model_answers():
+    client, backend = make_client()
+    result = asyncio.run(client.generate(("resume", "job", "v1"), "prompt", parse))
+
+    assert answered_by(result) == "model-a"
+    assert backend.calls == ["model-a"]
+
+
+def test_rate_limited_model_is_skipped_on_the_next_call():
+    client, backend = make_client({"model-a": {"mode": "rate_limit"}})
+
+    async def body():
+        first = await client.generate(("r", "job-1", "v1"), "prompt", parse)
+        second = await client.generate(("r", "job-2", "v1"), "prompt", parse)
+        return first, second
+
+    first, second = asyncio.run(body())
+    assert answered_by(first) == answered_by(second) == "model-b"
+    # A single 429 opens the breaker straight away: model-a isn't even tried the second time
+    assert backend.calls == ["model-a", "model-b", "model-b"]
+    assert client.breakers["model-a"].state == "open"
+
+
+def test_breaker_opens_then_half_opens_then_closes():
+    client, backend = make_client({"model-a": {"mode": "error"}})
+    breaker = client.breakers["model-a"]
+    breaker.cooldown = 0.1
+
+    async def body():
+        for i in range(breaker.failure_threshold):
+            await client.generate(("r", f"job-{i}", "v1"), "prompt", parse)
+        assert breaker.state == "open"
+        assert breaker.available() is False
+
+        await asyncio.sleep(0.15)
+        assert breaker.state == "half-open"
+
+        backend.behaviours["model-a"] = {"mode": "ok"}
+        result = await client.generate(("r", "recovered", "v1"), "prompt", parse)
+        assert answered_by(result) == "model-a"
+        assert breaker.state == "closed"
+
+    asyncio.run(body())
+
+
+def test_failed_half_open_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=0.05)
+    for _ in range(3):
+        breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.try_acquire()
+    breaker.record_failure()  # one failure is enough while half-open
+    assert breaker.state == "open"
+
+
+def test_half_open_lets_a_single_probe_through():
+    client, backend = make_client({"model-a": {"latency": 0.2}})
+    breaker = client.breakers["model-a"]
+    breaker.open_until = time.monotonic() - 1  # cooldown just ran out
+    assert breaker.state == "half-open"
+
+    async def body():
+        return await asyncio.gather(*(client.generate(("r", f"job-{i}", "v1"), "prompt", parse) for i in range(5)))
+
+    results = asyncio.run(body())
+    assert sorted(answered_by(r) for r in results) == ["model-a"] + ["model-b"] * 4
+    assert backend.calls.count("model-a") == 1
+    assert breaker.state == "closed"
+
+
+def test_falls_back_when_the_budget_runs_out():
+    client, _ = make_client({"model-a": {"latency": 0.5}}, budget=0.2, attempt_timeout=1.0)
+
+    async def body():
+        # Timed in here: asyncio.run() itself waits for the abandoned backend thread
+        start = time.perf_counter()
+        result = await client.generate(("r", "job", "v1"), "prompt", parse)
+        return result, time.perf_counter() - start
+
+    result, elapsed = asyncio.run(body())
+    assert result is None
+    assert elapsed < 0.45
+    assert client.health()["budget_exhausted"] == 1
+
+
+def test_attempt_cut_short_by_the_budget_does_not_count_against_the_model():
+    # model-a times out and eats most of the budget; model-b answers in 0.15s
+    # but is only left 0.1s until model-a's breaker opens
+    client, _ = make_client({"model-a": {"latency": 0.5}, "model-b": {"latency": 0.15}},
+                            budget=0.3, attempt_timeout=0.2)
+
+    async def body():
+        for i in range(3):
+            assert await client.generate(("r", f"job-{i}", "v1"), "prompt", parse) is None
+        return await client.generate(("r", "job-3", "v1"), "prompt", parse)
+
+    result = asyncio.run(body())
+    assert client.breakers["model-a"].state == "open"  # timed out with its full attempt_timeout
+    assert client.breakers["model-b"].total_failures == 0
+    assert answered_by(result) == "model-b"
+    assert client.health()["budget_exhausted"] == 3
+
+
+def test_cache_is_keyed_on_resume_job_and_prompt_version():
+    client, backend = make_client()
+
+    async def body():
+        await client.generate(("resume-1", "job-1", "v1"), "prompt", parse)
+        await client.generate(("resume-1", "job-1", "v1"), "prompt", parse)
+        await client.generate(("resume-1", "job-1", "v2"), "prompt", parse)
+        await client.generate(("resume-2", "job-1", "v1"), "prompt", parse)
+        await client.generate(("resume-1", "job-2", "v1"), "prompt", parse)
+
+    asyncio.run(body())
+    assert len(backend.calls) == 4
+    assert client.health()["cache_hits"] == 1
+
+
+def test_failed_answers_are_not_cached():
+    client, backend = make_client({"model-a": {"mode": "garbage"}, "model-b": {"mode": "error"}})
+
+    async def body():
+        assert await client.generate(("r", "job", "v1"), "prompt", parse) is None
+        backend.behaviours.clear()
+        client.breakers["model-a"].record_success()
+        client.breakers["model-b"].record_success()
+        return await client.generate(("r", "job", "v1"), "prompt", parse)
+
+    assert answered_by(asyncio.run(body())) == "model-a"
+    assert client.health()["cache_hits"] == 0
+
+
+def test_concurrent_identical_keys_share_one_call():
+    client, backend = make_client({"model-a": {"latency": 0.1}})
+
+    async def body():
+        return await asyncio.gather(*(client.generate(("r", "job", "v1"), "prompt", parse) for _ in range(5)))
+
+    results = asyncio.run(body())
+    assert all(r == results[0] for r in results)
+    assert backend.calls == ["model-a"]
+    assert client.health()["coalesced"] == 4
+
+
+def test_stream_switches_models_when_one_dies_mid_answer():
+    client, _ = make_client({"model-a": {"mode": "drop"}})
+    tokens = []
+
+    async def on_token(model_name, text):
+        tokens.append((model_name, text))
+
+    result = asyncio.run(client.stream(("r", "job", "v1"), "prompt", parse, on_token))
+
+    models_in_order = [m for i, (m, _) in enumerate(tokens) if i == 0 or tokens[i - 1][0] != m]
+    assert models_in_order == ["model-a", "model-b"]
+    assert answered_by(result) == "model-b"
+    # What model-b streamed is its whole answer, so a client that reset its buffer has it all
+    assert parse("".join(t for m, t in tokens if m == "model-b")) == result
+
+
+def test_stream_returns_cached_answer_without_tokens():
+    client, _ = make_client()
+    tokens = []
+
+    async def on_token(model_name, text):
+        tokens.append(text)
+
+    async def body():
+        first = await client.stream(("r", "job", "v1"), "prompt", parse, on_token)
+        streamed = len(tokens)
+        second = await client.stream(("r", "job", "v1"), "prompt", parse, on_token)
+        return first, second, streamed
+
+    first, second, streamed = asyncio.run(body())
+    assert first == second
+    assert streamed > 0 and len(tokens) == streamed
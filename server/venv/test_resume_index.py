@@ -0,0 +1,117 @@
+"""ResumeIndex search, updates and its on-disk log. Run with: python -m pytest test_resume_index.py"""
+import random
+
+import pytest
+
+from resume_index import ResumeIndex
+
+SKILLS = [f"skill-{i}" for i in range(30)]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "resume_index.jsonl")
+
+
+def brute_force(live, required, k):
+    """Every live resume scored directly; ties go to the one indexed first"""
+    required = set(required)
+    scored = [(resume_id, name, skills) for resume_id, (name, skills) in live.items() if skills & required]
+    scored.sort(key=lambda doc: -len(doc[2] & required))  # stable: keeps indexing order
+    return [(resume_id, name, sorted(skills & required), sorted(required - skills))
+            for resume_id, name, skills in scored[:k]]
+
+
+def test_search_matches_brute_force_through_adds_deletes_and_re_adds(log_path):
+    rng = random.Random(7)
+    index = ResumeIndex(log_path=log_path)
+    live = {}  # resume_id -> (name, skills), in indexing order like the index
+
+    for step in range(1500):
+        resume_id = f"resume-{rng.randrange(300)}"
+        if rng.random() < 0.2:
+            assert index.delete(resume_id) == (resume_id in live)
+            live.pop(resume_id, None)
+        else:
+            # Skewed, so some posting lists are long and others rare
+            skills = {s for s in SKILLS if rng.random() < 1 / (1 + SKILLS.index(s) / 3)}
+            name = f"{resume_id}.pdf@{step}"
+            index.add(resume_id, skills, name)
+            live.pop(resume_id, None)  # a re-add counts as indexed last
+            live[resume_id] = (name, skills)
+
+        if step % 10 == 0:
+            required = rng.sample(SKILLS, rng.randint(1, 8))
+            k = rng.choice([1, 3, 10, 50])
+            assert index.search(required, k) == brute_force(live, required, k)
+
+    assert len(index) == len(live)
+
+
+def test_early_stop_keeps_the_tie_rule(log_path):
+    index = ResumeIndex(log_path=log_path)
+    index.add("first", {"python"}, "first.pdf")
+    index.add("other", {"python"}, "other.pdf")
+    index.add("rare", {"cobol"}, "rare.pdf")
+
+    # All three match one skill: the one indexed first wins, even though the rare
+    # skill's list is scanned first and "rare" is the only resume seen at that point
+    assert [r[0] for r in index.search({"python", "cobol"}, 1)] == ["first"]
+
+
+def test_add_delete_re_add(log_path):
+    index = ResumeIndex(log_path=log_path)
+    index.add("a", {"python", "sql"}, "a.pdf")
+    index.add("b", {"python"}, "b.pdf")
+    assert [r[0] for r in index.search({"python"}, 10)] == ["a", "b"]
+
+    assert index.delete("a") is True
+    assert index.delete("a") is False
+    assert index.search({"sql"}, 10) == []
+    assert "sql" not in index.postings  # empty posting lists are dropped
+
+    # Re-added with new skills: indexed after b now, and the old skills are gone
+    index.add("a", {"python", "java"}, "a-v2.pdf")
+    assert index.search({"python", "java", "sql"}, 10) == [
+        ("a", "a-v2.pdf", ["java", "python"], ["sql"]),
+        ("b", "b.pdf", ["python"], ["java", "sql"]),
+    ]
+    assert len(index) == 2
+
+
+def test_log_replay_restores_the_index(log_path):
+    index = ResumeIndex(log_path=log_path)
+    index.add("a", {"python", "sql"}, "a.pdf")
+    index.add("b", {"java"}, "b.pdf")
+    index.add("c", {"python"}, "c.pdf")
+    index.delete("b")
+    index.add("a", {"python", "docker"}, "a-v2.pdf")
+
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "resume_id": "torn", "ski')  # crash mid-write
+
+    replayed = ResumeIndex(log_path=log_path)
+    assert len(replayed) == 2
+    for required in ({"python"}, {"python", "docker", "sql"}, {"java"}):
+        assert replayed.search(required, 10) == index.search(required, 10)
+
+
+def test_compaction_rewrites_the_log_and_round_trips(log_path):
+    index = ResumeIndex(log_path=log_path)
+    index.add("keep", {"python", "sql"}, "keep.pdf")
+    index.add("gone", {"java"}, "gone.pdf")
+    index.delete("gone")
+    for i in range(1100):
+        index.add("busy", {"python", f"skill-{i % 3}"}, f"busy-{i}.pdf")
+
+    # Compacted at least once: far fewer lines than operations
+    with open(log_path, encoding="utf-8") as f:
+        lines = f.readlines()
+    assert len(lines) < 1000
+    assert index._log_lines == len(lines)
+
+    replayed = ResumeIndex(log_path=log_path)
+    assert len(replayed) == 2
+    assert replayed.search({"python", "java", "skill-0", "skill-1", "skill-2"}, 10) == \
+        index.search({"python", "java", "skill-0", "skill-1", "skill-2"}, 10)
+    assert replayed.search({"java"}, 10) == []
@@ -0,0 +1,107 @@
+"""SkillMatcher boundaries, aliases and positions. Run with: python -m pytest test_skill_matcher.py"""
+import re
+
+import pytest
+
+from skill_matcher import SkillMatcher
+
+SKILLS = {
+    "c", "c++", "c#", "ci/cd", "next.js", "node.js", ".net", "java", "javascript", "r",
+    "machine learning", "deep learning", "kubernetes", "sql", "mysql", "power bi",
+}
+ALIASES = {"k8s": "kubernetes", "ml": "machine learning", "nodejs": "node.js", "nextjs": "next.js"}
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return SkillMatcher(SKILLS, ALIASES)
+
+
+def legacy_skills(text):
+    """The loop SkillMatcher replaced, kept here to pin the differences"""
+    return {s for s in SKILLS if re.search(r"\b" + re.escape(s) + r"\b", text.lower())}
+
+
+@pytest.mark.parametrize("text, skill", [
+    ("Strong C++ and Java", "c++"),
+    ("C#/.NET developer", "c#"),
+    ("Built CI/CD pipelines", "ci/cd"),
+    ("Frontend in Next.js.", "next.js"),
+    ("Node.js, Express", "node.js"),
+    ("(c++)", "c++"),
+])
+def test_punctuated_skills_match_as_whole_words(matcher, text, skill):
+    assert skill in matcher.skills(text)
+
+
+@pytest.mark.parametrize("text, skill", [
+    ("JavaScript", "java"),
+    ("MySQL", "sql"),
+    ("Car rental", "c"),
+    ("Rust", "r"),
+    ("next.jsx", "next.js"),
+    ("c++11", "c++"),
+])
+def test_skills_glued_to_letters_or_digits_do_not_match(matcher, text, skill):
+    assert skill not in matcher.skills(text)
+
+
+def test_matching_is_case_insensitive(matcher):
+    assert matcher.skills("JAVA, Kubernetes, SQL") == {"java", "kubernetes", "sql"}
+
+
+def test_aliases_map_to_the_canonical_skill(matcher):
+    assert matcher.skills("k8s, ML and nodejs, NextJS") == {"kubernetes", "machine learning", "node.js", "next.js"}
+
+
+def test_multi_word_skills_span_any_whitespace(matcher):
+    assert "machine learning" in matcher.skills("Machine\n   Learning")
+    assert "power bi" in matcher.skills("Power\tBI dashboards")
+    assert "machine learning" not in matcher.skills("machinelearning")
+
+
+def test_overlapping_skills_are_all_reported(matcher):
+    skills = matcher.skills("deep learning and machine learning")
+    assert {"deep learning", "machine learning"} <= skills
+
+
+def test_positions_point_into_the_raw_text(matcher):
+    text = "Java, C++ and Machine  Learning (ML)"
+    positions = matcher.scan(text)
+
+    assert positions["java"] == [(0, 4)]
+    assert positions["c++"] == [(6, 9)]
+    assert positions["machine learning"] == [(14, 31), (33, 35)]
+    for spans in positions.values():
+        for start, end in spans:
+            assert text[start:end].strip()
+
+
+def test_nested_prefix_skill_gets_its_own_span(matcher):
+    # "c" ends on a boundary inside "c++", like the old r'\bc\b' search found it
+    assert matcher.scan("C++ dev") == {"c++": [(0, 3)], "c": [(0, 1)]}
+
+
+def test_counts(matcher):
+    assert matcher.counts("java, Java; JAVA javascript k8s kubernetes") == {
+        "java": 3, "javascript": 1, "kubernetes": 2}
+
+
+def test_empty_inputs():
+    assert SkillMatcher([]).skills("java") == set()
+    assert SkillMatcher(SKILLS).scan("") == {}
+
+
+# --- Deliberate differences from the old r'\b' + skill + r'\b' loop ---
+
+def test_trailing_punctuation_skill_now_matches_before_a_comma(matcher):
+    text = "Languages: c++, c#, java"
+    assert "c++" not in legacy_skills(text) and "c#" not in legacy_skills(text)
+    assert {"c++", "c#"} <= matcher.skills(text)
+
+
+def test_leading_punctuation_skill_no_longer_matches_inside_a_word(matcher):
+    # The old \b before "." matched anywhere after a letter, so asp.net counted as .net
+    assert ".net" in legacy_skills("ASP.NET Core")
+    assert ".net" not in matcher.skills("ASP.NET Core")
+    assert ".net" in matcher.skills("C# and .NET")
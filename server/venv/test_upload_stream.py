@@ -0,0 +1,145 @@
+"""Streaming multipart uploads, on their own and through /upload-resume. Run with: python -m pytest test_upload_stream.py"""
+import asyncio
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from bench_api import make_pdf
+from upload_stream import BadUpload, UploadTooLarge, stream_file_field
+
+BOUNDARY = "test-boundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def multipart(*parts):
+    """Body for (name, filename or None, data) parts"""
+    body = b""
+    for name, filename, data in parts:
+        disposition = f'form-data; name="{name}"' + (f'; filename="{filename}"' if filename else "")
+        body += f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n".encode() + data + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+class FakeRequest:
+    def __init__(self, body, chunk_size=7, headers=None):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.headers = {"content-type": CONTENT_TYPE, **(headers or {})}
+
+    async def stream(self):
+        for i in range(0, len(self.body), self.chunk_size):
+            yield self.body[i:i + self.chunk_size]
+
+
+def read_field(request, max_bytes=1 << 20):
+    received = []
+
+    async def write(chunk):
+        received.append(chunk)
+
+    filename = asyncio.run(stream_file_field(request, "file", write, max_bytes))
+    return filename, b"".join(received)
+
+
+# --- stream_file_field ---
+
+def test_file_bytes_survive_chunk_boundaries():
+    data = bytes(range(256)) * 20 + b"\r\n--not-the-boundary\r\n"
+    body = multipart(("note", None, b"hello"), ("file", "cv.pdf", data))
+    assert read_field(FakeRequest(body, chunk_size=7)) == ("cv.pdf", data)
+
+
+def test_field_without_a_filename_is_not_the_file():
+    body = multipart(("file", None, b"just text"), ("file", "cv.pdf", b"PDF"))
+    assert read_field(FakeRequest(body)) == ("cv.pdf", b"PDF")
+
+
+def test_second_file_in_the_field_is_rejected():
+    body = multipart(("file", "a.pdf", b"AAAA"), ("file", "b.pdf", b"BBBB"))
+    with pytest.raises(BadUpload, match="More than one file"):
+        read_field(FakeRequest(body))
+
+
+def test_declared_length_over_the_limit_is_refused_before_reading():
+    request = FakeRequest(b"", headers={"content-length": "2000"})
+    request.stream = None  # reading the body would fail
+    with pytest.raises(UploadTooLarge):
+        read_field(request, max_bytes=1000)
+
+
+def test_body_over_the_limit_is_refused_while_reading():
+    body = multipart(("file", "cv.pdf", b"x" * 5000))
+    with pytest.raises(UploadTooLarge):
+        read_field(FakeRequest(body, chunk_size=512), max_bytes=1000)
+
+
+def test_not_multipart_is_rejected():
+    with pytest.raises(BadUpload, match="multipart/form-data"):
+        read_field(FakeRequest(b"{}", headers={"content-type": "application/json"}))
+
+
+# --- /upload-resume ---
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    # uploads/, resume_cache/ and resume_index.jsonl are created in the working directory
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("server"))
+    import main
+    try:
+        with TestClient(main.app) as client:
+            yield client
+    finally:
+        os.chdir(cwd)
+
+
+def post(client, body, **kwargs):
+    return client.post("/upload-resume", content=body, headers={"content-type": CONTENT_TYPE}, **kwargs)
+
+
+def leftovers():
+    return sorted(os.listdir("uploads")) if os.path.isdir("uploads") else []
+
+
+def test_upload_is_stored_under_its_hash(client):
+    pdf = make_pdf(2, seed=1)
+    response = post(client, multipart(("file", "cv.pdf", pdf)))
+
+    assert response.status_code == 200
+    assert response.json()["pages"] == 2
+    with open(response.json()["filename"], "rb") as f:
+        assert f.read() == pdf
+
+
+def test_oversized_upload_is_413(client):
+    before = leftovers()
+    body = multipart(("file", "big.pdf", b"x" * (10 * 1024 * 1024 + 1)))
+    assert post(client, body).status_code == 413
+
+    # Chunked, so there is no Content-Length to refuse it up front
+    def chunks():
+        for i in range(0, len(body), 64 * 1024):
+            yield body[i:i + 64 * 1024]
+
+    assert post(client, chunks()).status_code == 413
+    assert leftovers() == before
+
+
+def test_malformed_body_is_400(client):
+    response = post(client, b"this is not multipart at all")
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Malformed upload")
+
+
+def test_missing_file_field_is_400(client):
+    response = post(client, multipart(("resume", "cv.pdf", b"PDF")))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Missing file field 'file'"
+
+
+def test_duplicate_file_field_is_400_and_nothing_is_stored(client):
+    before = leftovers()
+    response = post(client, multipart(("file", "a.pdf", b"AAAA"), ("file", "b.pdf", b"BBBB")))
+    assert response.status_code == 400
+    assert leftovers() == before
@@ -0,0 +1,94 @@
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+# ==========================================================
+# 📥 STREAMING MULTIPART UPLOADS
+# ==========================================================
+# FastAPI's UploadFile parameters are filled before the handler runs: the whole
+# body is received and spooled to /tmp first, so a size check in the handler
+# comes too late. Here the raw request body is parsed chunk by chunk as it
+# arrives, and the upload is refused as soon as it is too large.
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class BadUpload(Exception):
+    pass
+
+
+async def stream_file_field(request, field_name, write, max_bytes):
+    """Feeds the file part `field_name` of a multipart/form-data request to `await write(chunk)`.
+
+    Raises UploadTooLarge before reading anything when Content-Length is over
+    max_bytes, or as soon as the body read so far is; BadUpload when the field is
+    missing or holds more than one file. Returns the client's filename.
+    """
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise UploadTooLarge()
+
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise BadUpload("Expected a multipart/form-data upload")
+
+    part = {"headers": {}, "field": b"", "value": b""}
+    found = {"filename": None}
+    pieces = []
+
+    def on_part_begin():
+        part["headers"] = {}
+
+    def on_header_field(data, start, end):
+        part["field"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        part["value"] += data[start:end]
+
+    def on_header_end():
+        part["headers"][part["field"].lower()] = part["value"]
+        part["field"], part["value"] = b"", b""
+
+    def on_headers_finished():
+        _, options = parse_options_header(part["headers"].get(b"content-disposition", b""))
+        part["target"] = options.get(b"name") == field_name.encode() and b"filename" in options
+        if part["target"]:
+            # A second file would be appended to the first one's bytes
+            if found["filename"] is not None:
+                raise BadUpload(f"More than one file in field '{field_name}'")
+            found["filename"] = options[b"filename"].decode("utf-8", "replace")
+
+    def on_part_data(data, start, end):
+        if part["target"]:
+            pieces.append(data[start:end])
+
+    parser = MultipartParser(params[b"boundary"], {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+    })
+
+    received = 0
+    try:
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_bytes:
+                raise UploadTooLarge()
+            parser.write(chunk)
+            # The parser calls back synchronously; hand the file bytes over once per chunk
+            for piece in pieces:
+                await write(piece)
+            pieces.clear()
+        parser.finalize()
+    except ValueError as e:  # python-multipart's parse errors
+        raise BadUpload(f"Malformed upload: {e}")
+
+    if found["filename"] is None:
+        raise BadUpload(f"Missing file field '{field_name}'")
+    return found["filename"]